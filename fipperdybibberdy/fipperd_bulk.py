@@ -0,0 +1,159 @@
+"""
+FIPPERD Bulk Nomination Generator
+Render nomination drafts for every technician x client pair without opening the window,
+streaming them to CSV or JSON lines.
+
+Technicians come from --technician or a --technicians file with one "Name" or
+"Name,Team" per line. A technician with a team gets a draft for each of that team's
+clients; one without gets a draft for every client of every team. With --seed,
+every draft is drawn from its own generator seeded by the seed and its position, so
+the output is identical whatever the number of worker processes.
+
+Usage:
+    python fipperd_bulk.py --technicians technicians.txt --output drafts.csv
+    python fipperd_bulk.py --technician "Pat Smith" --team Gemini --format jsonl --seed 42
+    python fipperd_bulk.py --technicians technicians.csv --workers 8 --output drafts.jsonl
+"""
+
+import argparse
+import csv
+import functools
+import json
+import multiprocessing
+import os
+import random
+import sys
+
+from fipperd_engine import NominationEngine
+
+FIELDS = ("technician", "team", "client", "category", "action", "outcome", "location", "circumstance", "nomination")
+
+# Generator of this process, loaded once per worker
+_generator = None
+
+def read_technicians(path):
+    """Read (name, team or None) pairs from a file of "Name" or "Name,Team" lines"""
+    technicians = []
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.reader(f):
+            if not row or not row[0].strip() or row[0].startswith('#'):
+                continue
+            team = row[1].strip() if len(row) > 1 and row[1].strip() else None
+            technicians.append((row[0].strip(), team))
+    return technicians
+
+def iter_jobs(technicians, teams):
+    """Yield (index, technician, team, client) for every technician x client pair"""
+    index = 0
+    for name, technician_team in technicians:
+        for team, clients in teams.items():
+            if technician_team and team != technician_team:
+                continue
+            for client in clients:
+                yield index, name, team, client
+                index += 1
+
+def _init_worker():
+    global _generator
+    _generator = NominationEngine()
+
+def render_job(job, seed=None, mode="specific", category=None, include_intro=True):
+    """Render one draft as a record with FIELDS keys"""
+    index, name, team, client = job
+    rng = random.Random(f"{seed}:{index}") if seed is not None else random.Random()
+    record = dict.fromkeys(FIELDS, "")
+    record.update(technician=name, team=team, client=client)
+    if mode == "template":
+        record["category"] = category or rng.choice(list(_generator.fipperd_templates.keys()))
+        record["nomination"] = _generator.render_template_nomination(name, client, record["category"], rng)
+        return record
+
+    selected_category, action, outcome, location, circumstance = _generator.random_selection(rng)
+    record.update(category=category or selected_category, action=action, outcome=outcome,
+                  location=location, circumstance=circumstance)
+    record["nomination"] = _generator.build_specific_nomination(name, client, record["category"], action, outcome,
+                                                                location, circumstance, include_intro, rng)
+    return record
+
+def write_records(records, fh, output_format):
+    """Stream records to fh as CSV or JSON lines; return how many were written"""
+    count = 0
+    if output_format == "csv":
+        writer = csv.DictWriter(fh, fieldnames=FIELDS)
+        writer.writeheader()
+        for record in records:
+            writer.writerow(record)
+            count += 1
+    else:
+        for record in records:
+            fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+            count += 1
+    return count
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate FIPPERD nominations in bulk, without a display')
+    parser.add_argument('--technician', action='append', default=[], help='Technician name (repeatable)')
+    parser.add_argument('--technicians', help='File with one "Name" or "Name,Team" per line')
+    parser.add_argument('--team', action='append', default=[], help='Only generate for clients of this team (repeatable)')
+    parser.add_argument('--teams-file', help='Teams JSON ({"teams": {team: [clients]}}) (default: the app settings next to fipperd_engine.py)')
+    parser.add_argument('--category', help='Use this FIPPERD category instead of a random one')
+    parser.add_argument('--mode', choices=('specific', 'template'), default='specific',
+                        help='specific: random action/outcome/location/circumstance; template: category templates (default: specific)')
+    parser.add_argument('--no-intro', action='store_true', help='Leave out the introductory sentence')
+    parser.add_argument('--seed', type=int, help='Seed for reproducible output')
+    parser.add_argument('--workers', type=int, default=1, help='Worker processes (default: 1)')
+    parser.add_argument('--output', help='Output file (default: stdout)')
+    parser.add_argument('--format', choices=('csv', 'jsonl'), help='Output format (default: from the output extension, else csv)')
+    args = parser.parse_args()
+
+    technicians = [(name, None) for name in args.technician]
+    if args.technicians:
+        technicians.extend(read_technicians(args.technicians))
+    if not technicians:
+        parser.error('give at least one --technician or a --technicians file')
+
+    _init_worker()
+    if args.teams_file:
+        with open(args.teams_file, 'r', encoding='utf-8') as f:
+            teams = json.load(f)["teams"]
+    elif _generator.teams_source is None:
+        parser.error('no teams found: extracted_teams.json and fipperd_settings.json are missing '
+                     'next to fipperd_engine.py; give a --teams-file')
+    else:
+        teams = _generator.settings["teams"]
+    unknown = sorted({team for _, team in technicians if team and team not in teams})
+    if unknown:
+        parser.error(f"unknown team in --technicians: {', '.join(unknown)}")
+    if args.team:
+        unknown = [team for team in args.team if team not in teams]
+        if unknown:
+            parser.error(f"unknown team: {', '.join(unknown)}")
+        teams = {team: clients for team, clients in teams.items() if team in args.team}
+    if args.category and args.category not in _generator.fipperd_templates:
+        parser.error(f"unknown category: {args.category}")
+
+    output_format = args.format or ("jsonl" if args.output and args.output.endswith(('.jsonl', '.json')) else "csv")
+    render = functools.partial(render_job, seed=args.seed, mode=args.mode, category=args.category,
+                               include_intro=not args.no_intro)
+    jobs = iter_jobs(technicians, teams)
+
+    fh = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+    try:
+        if args.workers > 1:
+            with multiprocessing.Pool(args.workers, initializer=_init_worker) as pool:
+                count = write_records(pool.imap(render, jobs, chunksize=64), fh, output_format)
+        else:
+            count = write_records(map(render, jobs), fh, output_format)
+        fh.flush()
+    except BrokenPipeError:
+        # The reader (e.g. head) went away; point stdout at devnull so the exit flush stays quiet
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(1)
+    finally:
+        if fh is not sys.stdout:
+            fh.close()
+    print(f"Wrote {count} nominations{' to ' + args.output if args.output else ''}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
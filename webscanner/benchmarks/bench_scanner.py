@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Scanner Microbenchmarks
+Times the CPU hot paths of PolyfillScanner (extract_links, scan_content, scan_bytes,
+normalize_url, is_valid_url and report generation) over the checked-in corpus in
+benchmarks/corpus, and appends the results to a JSON-lines history so regressions
+in the matching engines show up before release.
+
+Corpus:
+    index_links.html   link-dense catalogue page (thousands of hrefs, srcs, form actions)
+    article.html       typical content page with inline and async scripts
+    bundle.min.js      minified webpack-style bundle
+    pathological.html  unterminated attributes and <script> tags that force long regex scans
+
+Usage:
+    python benchmarks/bench_scanner.py
+    python benchmarks/bench_scanner.py --repeat 10 --filter extract_links
+    python benchmarks/bench_scanner.py --no-history --threshold 0.15
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from malware_scanner import PolyfillScanner, ScanResult
+from url_model import _join, _parse_absolute
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+CORPUS_DIR = os.path.join(BENCH_DIR, 'corpus')
+DEFAULT_HISTORY = os.path.join(BENCH_DIR, 'bench_history.jsonl')
+BASE_URL = 'https://www.example.com/catalogue/index.html'
+
+
+def load_corpus() -> Dict[str, str]:
+    """Read every corpus file, keyed by file name"""
+    corpus = {}
+    for name in sorted(os.listdir(CORPUS_DIR)):
+        with open(os.path.join(CORPUS_DIR, name), 'r', encoding='utf-8') as f:
+            corpus[name] = f.read()
+    return corpus
+
+
+def clear_url_cache():
+    """Make URL benchmarks measure parsing rather than LRU hits"""
+    _parse_absolute.cache_clear()
+    _join.cache_clear()
+
+
+def time_call(func: Callable[[], object], repeat: int, setup: Optional[Callable[[], None]] = None) -> float:
+    """Return the best wall-clock time over several runs"""
+    best = float('inf')
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def build_benchmarks(scanner: PolyfillScanner, corpus: Dict[str, str]) -> List[Tuple[str, Callable, Optional[Callable], int]]:
+    """Return (name, function, per-run setup, bytes processed) for every benchmark"""
+    benchmarks = []
+    for name, content in corpus.items():
+        data = content.encode('utf-8')
+        size = len(data)
+        benchmarks.append((f'extract_links[{name}]', lambda c=content: scanner.extract_links(c, BASE_URL),
+                           clear_url_cache, size))
+        benchmarks.append((f'scan_content[{name}]', lambda c=content: scanner.scan_content(c, BASE_URL), None, size))
+        benchmarks.append((f'scan_bytes[{name}]', lambda d=data: scanner.scan_bytes(d, BASE_URL), None, size))
+
+    # Raw link strings as they appear in the index page, relative and absolute
+    links = sorted(scanner.extract_links(corpus['index_links.html'], BASE_URL))
+    raw_links = [link.replace('https://www.example.com', '') for link in links] * 4
+    benchmarks.append(('normalize_url[cold]', lambda: [scanner.normalize_url(link, BASE_URL) for link in raw_links],
+                       clear_url_cache, 0))
+    benchmarks.append(('normalize_url[warm]', lambda: [scanner.normalize_url(link, BASE_URL) for link in raw_links],
+                       None, 0))
+    benchmarks.append(('is_valid_url[cold]', lambda: [scanner.is_valid_url(link) for link in links * 4],
+                       clear_url_cache, 0))
+
+    # Report generation over a large result set
+    report_scanner = PolyfillScanner()
+    report_scanner.scan_results.extend(
+        ScanResult(f'https://site{i % 200}.example.com/page/{i}', 'polyfill.io',
+                   'Polyfill.io CDN - potentially compromised', 'HIGH', f'Found at position {i}: polyfill.io')
+        for i in range(20000)
+    )
+    benchmarks.append(('write_report[20k results]',
+                       lambda: report_scanner.write_report(io.StringIO(), rollups=True), None, 0))
+    return benchmarks
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCH_DIR, capture_output=True,
+                              text=True, timeout=5).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ''
+
+
+def baseline_results(history_file: str) -> Dict[str, Tuple[float, str]]:
+    """Latest recorded (time, revision or date) of every benchmark run on this Python and machine"""
+    baseline = {}
+    if not os.path.exists(history_file):
+        return baseline
+    environment = (platform.python_version(), platform.machine())
+    with open(history_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                # Timings from another interpreter or CPU would show up as regressions or speedups
+                if (record.get('python'), record.get('machine')) != environment:
+                    continue
+                label = record.get('revision') or record.get('date')
+                for name, elapsed in record['results'].items():
+                    baseline[name] = (elapsed, label)
+    return baseline
+
+
+def main():
+    """Main function with command-line interface"""
+    parser = argparse.ArgumentParser(description='PolyfillScanner microbenchmarks')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per benchmark, best is reported (default: 5)')
+    parser.add_argument('--filter', help='Only run benchmarks whose name contains this string')
+    parser.add_argument('--history', default=DEFAULT_HISTORY, help='JSON-lines results history (default: benchmarks/bench_history.jsonl)')
+    parser.add_argument('--no-history', action='store_true', help='Compare against the history but do not append to it')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='Report benchmarks slower than the previous run by more than this fraction (default: 0.10)')
+    args = parser.parse_args()
+
+    scanner = PolyfillScanner(delay=0)
+    benchmarks = build_benchmarks(scanner, load_corpus())
+    baseline = baseline_results(args.history)
+
+    results = {}
+    regressions = []
+    for name, func, setup, size in benchmarks:
+        if args.filter and args.filter not in name:
+            continue
+        elapsed = time_call(func, args.repeat, setup)
+        results[name] = elapsed
+        line = f"{name:42} {elapsed * 1000:9.2f} ms"
+        if size:
+            line += f"  {size / (1024 * 1024) / elapsed:8.2f} MB/s"
+        if name in baseline:
+            previous, label = baseline[name]
+            change = elapsed / previous - 1
+            line += f"  {change:+7.1%} vs {label}"
+            if change > args.threshold:
+                regressions.append(name)
+        print(line)
+
+    if regressions:
+        print(f"\n{len(regressions)} benchmarks regressed by more than {args.threshold:.0%}: {', '.join(regressions)}")
+
+    if not args.no_history:
+        record = {
+            'date': datetime.now().isoformat(timespec='seconds'),
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'repeat': args.repeat,
+            'results': results,
+        }
+        with open(args.history, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, sort_keys=True) + '\n')
+        print(f"\nAppended results to {args.history}")
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,350 @@
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;import("./lazy-"+e+".js").then(function(m){return m.default});/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}import("./lazy-"+e+".js").then(function(m){return m.default});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};import("./lazy-"+e+".js").then(function(m){return m.default});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};/* license header */for(var i=0;i<n.length;i++){r+=n[i]*2}//tail comment
+var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;var o={name:"x",items:[1,2,3],label:`tpl ${a+b} done`,msg:"don't \"quote\""};var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"var a=document.createElement("script");a.src="https://polyfill.io/v3/polyfill.min.js?features=es6";function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};if(/^[a-z0-9_-]+$/i.test(e))return e.replace(/\//g,"_");var s=i/2/3;e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"import("./lazy-"+e+".js").then(function(m){return m.default});loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"n.p+"static/js/"+({1:"vendors"}[e]||e)+"."+{0:"a1b2c3",1:"d4e5f6",2:"0718ab"}[e]+".chunk.js"e.exports=function(t){return Array.from(t).map(function(x){return x.toString(16)})};function(e,t,n){"use strict";var r=n(12),o=n.n(r);t.a=function(e){return o()(e)}}loadScript("/assets/widget.js",function(){window.widget.init({el:"#w",theme:"dark"})});
\ No newline at end of file
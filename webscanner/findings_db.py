@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Findings Database
+Persistent SQLite store of polyfill.io scan runs, fetched URLs, content hashes
+and findings, so results can be queried across runs instead of grepping exports.
+
+Usage:
+    python findings_db.py polyfill_findings.db --since 7d
+    python findings_db.py polyfill_findings.db --since 7d --severity HIGH --list
+    python findings_db.py polyfill_findings.db --runs
+"""
+
+import argparse
+import logging
+import queue
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from url_model import host_of
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS targets (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    domain TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    target_id INTEGER NOT NULL REFERENCES targets(id),
+    started_ns INTEGER NOT NULL,
+    finished_ns INTEGER,
+    urls_scanned INTEGER,
+    findings INTEGER
+);
+CREATE TABLE IF NOT EXISTS urls (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    domain TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS fetches (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    url_id INTEGER NOT NULL REFERENCES urls(id),
+    status INTEGER NOT NULL,
+    content_hash TEXT,
+    fetched_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS findings (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    url_id INTEGER NOT NULL REFERENCES urls(id),
+    domain TEXT NOT NULL,
+    threat_type TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    description TEXT NOT NULL,
+    details TEXT,
+    found_ns INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_findings_domain_time ON findings(domain, found_ns);
+CREATE INDEX IF NOT EXISTS idx_findings_severity_time ON findings(severity, found_ns);
+CREATE INDEX IF NOT EXISTS idx_findings_time ON findings(found_ns);
+CREATE INDEX IF NOT EXISTS idx_findings_run ON findings(run_id);
+CREATE INDEX IF NOT EXISTS idx_fetches_url_time ON fetches(url_id, fetched_ns);
+CREATE INDEX IF NOT EXISTS idx_runs_target_time ON runs(target_id, started_ns);
+"""
+
+
+def domain_of(url: str) -> str:
+    """Return the lower-cased host of a URL"""
+    return host_of(url)
+
+
+def parse_since(value: str) -> int:
+    """Parse '7d', '12h', '30m' or an ISO date into epoch nanoseconds"""
+    match = re.fullmatch(r'(\d+)([smhdw])', value.strip())
+    if match:
+        seconds = int(match.group(1)) * {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}[match.group(2)]
+        return time.time_ns() - seconds * 1_000_000_000
+    return int(datetime.fromisoformat(value).timestamp() * 1_000_000_000)
+
+
+class FindingsDatabase:
+    """SQLite (WAL mode) findings store with a background writer that batches inserts from crawl workers"""
+
+    def __init__(self, path: str, batch_size: int = 500, flush_interval: float = 0.5):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+        self._queue: queue.Queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name='findings-db-writer', daemon=True)
+        self._writer.start()
+
+    # Writing
+
+    def start_run(self, target: str) -> int:
+        """Record the start of a scan run and return its id"""
+        with self._lock:
+            self._conn.execute('INSERT OR IGNORE INTO targets(url, domain) VALUES (?, ?)', (target, domain_of(target)))
+            cursor = self._conn.execute(
+                'INSERT INTO runs(target_id, started_ns) VALUES ((SELECT id FROM targets WHERE url = ?), ?)',
+                (target, time.time_ns())
+            )
+            self._conn.commit()
+            return cursor.lastrowid
+
+    def finish_run(self, run_id: int, urls_scanned: int, findings: int):
+        """Flush pending rows and record the end of a scan run"""
+        self.flush()
+        with self._lock:
+            self._conn.execute(
+                'UPDATE runs SET finished_ns = ?, urls_scanned = ?, findings = ? WHERE id = ?',
+                (time.time_ns(), urls_scanned, findings, run_id)
+            )
+            self._conn.commit()
+
+    def add_fetch(self, run_id: int, url: str, status: int, content_hash: Optional[str]):
+        """Queue a fetched URL and its content hash (thread-safe, non-blocking)"""
+        self._queue.put(('fetch', (run_id, url, status, content_hash, time.time_ns())))
+
+    def add_findings(self, run_id: int, results: Iterable):
+        """Queue scan results for insertion (thread-safe, non-blocking)"""
+        for result in results:
+            self._queue.put(('finding', (
+                run_id, result.url, result.threat_type, result.severity,
+                result.description, result.details, result.timestamp_ns
+            )))
+
+    def flush(self):
+        """Block until every queued row has been written"""
+        self._queue.join()
+
+    def close(self):
+        """Flush pending rows, stop the writer and close the database"""
+        self.flush()
+        self._queue.put(None)
+        self._writer.join()
+        with self._lock:
+            self._conn.close()
+
+    def _write_loop(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    # Put the sentinel back so the loop exits after this batch
+                    self._queue.task_done()
+                    self._queue.put(None)
+                    break
+                batch.append(item)
+
+            try:
+                self._write_batch(batch)
+            except sqlite3.Error as e:
+                # Losing a batch must not kill the writer and hang flush()
+                logger.error(f"Findings database write failed: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write_batch(self, batch: List[tuple]):
+        fetches = [row for kind, row in batch if kind == 'fetch']
+        findings = [row for kind, row in batch if kind == 'finding']
+        urls = {row[1] for row in fetches} | {row[1] for row in findings}
+
+        with self._lock:
+            self._conn.executemany(
+                'INSERT OR IGNORE INTO urls(url, domain) VALUES (?, ?)',
+                [(url, domain_of(url)) for url in urls]
+            )
+            self._conn.executemany(
+                'INSERT INTO fetches(run_id, url_id, status, content_hash, fetched_ns) '
+                'VALUES (?, (SELECT id FROM urls WHERE url = ?), ?, ?, ?)',
+                fetches
+            )
+            self._conn.executemany(
+                'INSERT INTO findings(run_id, url_id, domain, threat_type, severity, description, details, found_ns) '
+                'VALUES (?, (SELECT id FROM urls WHERE url = ?), ?, ?, ?, ?, ?, ?)',
+                [(run_id, url, domain_of(url), threat_type, severity, description, details, found_ns)
+                 for run_id, url, threat_type, severity, description, details, found_ns in findings]
+            )
+            self._conn.commit()
+
+    # Querying
+
+    def _query(self, sql: str, params: tuple = ()) -> List[Dict]:
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            columns = [column[0] for column in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    @staticmethod
+    def _filters(since_ns: Optional[int], severity: Optional[str], domain: Optional[str],
+                 threat_type: Optional[str]) -> tuple:
+        clauses, params = [], []
+        if since_ns is not None:
+            clauses.append('f.found_ns >= ?')
+            params.append(since_ns)
+        if severity:
+            clauses.append('f.severity = ?')
+            params.append(severity)
+        if domain:
+            clauses.append('f.domain = ?')
+            params.append(domain.lower())
+        if threat_type:
+            clauses.append('f.threat_type = ?')
+            params.append(threat_type)
+        where = ('WHERE ' + ' AND '.join(clauses)) if clauses else ''
+        return where, tuple(params)
+
+    def domains_with_findings(self, since_ns: Optional[int] = None, severity: Optional[str] = None,
+                              domain: Optional[str] = None, threat_type: Optional[str] = None) -> List[Dict]:
+        """Summarize findings per domain: count, distinct URLs and last time seen"""
+        where, params = self._filters(since_ns, severity, domain, threat_type)
+        return self._query(
+            'SELECT f.domain AS domain, COUNT(*) AS findings, COUNT(DISTINCT f.url_id) AS urls, '
+            f'MAX(f.found_ns) AS last_seen_ns FROM findings f {where} '
+            'GROUP BY f.domain ORDER BY last_seen_ns DESC',
+            params
+        )
+
+    def find(self, since_ns: Optional[int] = None, severity: Optional[str] = None,
+             domain: Optional[str] = None, threat_type: Optional[str] = None, limit: int = 1000) -> List[Dict]:
+        """Return individual findings, newest first"""
+        where, params = self._filters(since_ns, severity, domain, threat_type)
+        return self._query(
+            'SELECT f.run_id, u.url, f.domain, f.threat_type, f.severity, f.description, f.details, f.found_ns '
+            f'FROM findings f JOIN urls u ON u.id = f.url_id {where} ORDER BY f.found_ns DESC LIMIT ?',
+            params + (limit,)
+        )
+
+    def runs(self, limit: int = 50) -> List[Dict]:
+        """Return recent scan runs, newest first"""
+        return self._query(
+            'SELECT r.id, t.url AS target, r.started_ns, r.finished_ns, r.urls_scanned, r.findings '
+            'FROM runs r JOIN targets t ON t.id = r.target_id ORDER BY r.started_ns DESC LIMIT ?',
+            (limit,)
+        )
+
+
+def format_ns(value: Optional[int]) -> str:
+    """Format epoch nanoseconds for display"""
+    if not value:
+        return '-'
+    return datetime.fromtimestamp(value / 1e9).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def main():
+    """Main function with command-line interface"""
+    parser = argparse.ArgumentParser(description='Query the polyfill.io findings database')
+    parser.add_argument('database', help='Findings database file (created by malware_scanner.py --db)')
+    parser.add_argument('--since', help="Only findings since a duration ('7d', '12h') or ISO date")
+    parser.add_argument('--severity', help='Only findings with this severity (e.g. HIGH)')
+    parser.add_argument('--domain', help='Only findings on this domain')
+    parser.add_argument('--type', dest='threat_type', help='Only findings of this threat type (e.g. polyfill.io)')
+    parser.add_argument('--list', action='store_true', help='List individual findings instead of a per-domain summary')
+    parser.add_argument('--runs', action='store_true', help='List recent scan runs')
+    parser.add_argument('--limit', type=int, default=1000, help='Maximum rows for --list/--runs (default: 1000)')
+    args = parser.parse_args()
+
+    db = FindingsDatabase(args.database)
+    try:
+        since_ns = parse_since(args.since) if args.since else None
+
+        if args.runs:
+            for run in db.runs(args.limit):
+                print(f"#{run['id']} {run['target']} started {format_ns(run['started_ns'])} "
+                      f"finished {format_ns(run['finished_ns'])} urls={run['urls_scanned']} findings={run['findings']}")
+        elif args.list:
+            for row in db.find(since_ns, args.severity, args.domain, args.threat_type, args.limit):
+                print(f"{format_ns(row['found_ns'])} [{row['severity']}] {row['url']} - {row['description']}")
+        else:
+            rows = db.domains_with_findings(since_ns, args.severity, args.domain, args.threat_type)
+            for row in rows:
+                print(f"{row['domain']}: {row['findings']} findings on {row['urls']} URLs, "
+                      f"last seen {format_ns(row['last_seen_ns'])}")
+            print(f"{len(rows)} domains with findings")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
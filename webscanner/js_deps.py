@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+JavaScript Dependency Extraction
+A lightweight JavaScript lexer used by the polyfill.io scanner to find scripts
+that are loaded dynamically, without running a browser.
+
+Detects:
+- static and dynamic imports (`import x from './a.js'`, `import('./b.js')`)
+- `export ... from` re-exports and `require(...)` calls
+- loader helpers (`loadScript(...)`, `$.getScript(...)`, `importScripts(...)`)
+- injected script tags (`s.src = '...'`, `s.setAttribute('src', '...')`)
+- webpack chunk maps (`n.p + "js/" + {0:"a1b2"}[e] + ".chunk.js"`)
+"""
+
+import re
+from typing import List, Set, Tuple
+
+# Token kinds
+STRING = 'str'
+NAME = 'name'
+NUMBER = 'num'
+PUNCT = 'punct'
+REGEX = 'regex'
+TEMPLATE = 'tmpl'
+
+Token = Tuple[str, str]
+
+# Functions whose first string argument is a script URL
+LOADER_NAMES = {
+    'import',
+    'require',
+    'importScripts',
+    'loadScript',
+    'getScript',
+    'loadJS',
+    'injectScript',
+    'addScript',
+}
+
+# Keywords after which a '/' starts a regular expression rather than a division
+_REGEX_PREFIX_KEYWORDS = {
+    'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void',
+    'throw', 'case', 'do', 'else', 'yield', 'await',
+}
+
+_SKIP = re.compile(r'(?:\s+|//[^\n]*|/\*.*?\*/)+', re.DOTALL)
+_COMMON = (
+    r'(?P<str>"(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\')'
+    r'|(?P<tmpl>`(?:[^`\\]|\\.)*`)'
+    r'|(?P<name>[A-Za-z_$][\w$]*)'
+    r'|(?P<num>\.?\d[\w.]*)'
+)
+_PUNCT = r'|(?P<punct>=>|\.\.\.|[=!]==?|[-+*%&|^<>]=|&&|\|\||\?\?|[-+]{2}|[{}()\[\];,.<>+\-*%&|^!~?:=/])'
+_TOKEN_DIV = re.compile(_COMMON + _PUNCT, re.DOTALL)
+_TOKEN_REGEX = re.compile(
+    _COMMON
+    + r'|(?P<regex>/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[A-Za-z]*)'
+    + _PUNCT,
+    re.DOTALL
+)
+
+# Cheap pre-filter: sources without any of these cannot yield a dependency
+_TRIGGER = re.compile(r'import|require|src|Script|loadJS|\.js\b')
+
+# Specifiers that look like fetchable script locations
+_URLISH = re.compile(r'^(?:https?:)?//|^\.{0,2}/', re.IGNORECASE)
+_SCRIPT_PATH = re.compile(r'\.m?js(?:[?#].*)?$', re.IGNORECASE)
+
+
+def _unquote(literal: str) -> str:
+    """Strip quotes from a string token and undo simple escapes"""
+    body = literal[1:-1]
+    if '\\' in body:
+        body = re.sub(r'\\(.)', r'\1', body)
+    return body
+
+
+def tokenize_js(source: str) -> List[Token]:
+    """Split JavaScript source into (kind, value) tokens, dropping comments and whitespace"""
+    tokens: List[Token] = []
+    append = tokens.append
+    pos = 0
+    length = len(source)
+    regex_allowed = True
+
+    while pos < length:
+        skip = _SKIP.match(source, pos)
+        if skip:
+            pos = skip.end()
+            if pos >= length:
+                break
+
+        pattern = _TOKEN_REGEX if regex_allowed else _TOKEN_DIV
+        match = pattern.match(source, pos)
+        if not match:
+            # Unknown character (e.g. stray unicode) - step over it
+            pos += 1
+            continue
+
+        kind = match.lastgroup
+        value = match.group(kind)
+        pos = match.end()
+
+        if kind == TEMPLATE and '${' not in value:
+            # Templates without substitutions behave like plain strings
+            append((STRING, value))
+        else:
+            append((kind, value))
+
+        if kind == PUNCT:
+            regex_allowed = value not in (')', ']', '}')
+        elif kind == NAME:
+            regex_allowed = value in _REGEX_PREFIX_KEYWORDS
+        else:
+            regex_allowed = False
+
+    return tokens
+
+
+def _is_script_specifier(spec: str) -> bool:
+    """Return True for specifiers that point at a script rather than a bare package"""
+    return bool(spec) and (_URLISH.match(spec) is not None or _SCRIPT_PATH.search(spec) is not None)
+
+
+def _skip_group(tokens: List[Token], start: int, step: int) -> int:
+    """Return the index of the bracket matching tokens[start], scanning in the given direction"""
+    opening, closing = ('([{', ')]}') if step > 0 else (')]}', '([{')
+    depth = 0
+    i = start
+    while 0 <= i < len(tokens):
+        kind, value = tokens[i]
+        if kind == PUNCT:
+            if value in opening:
+                depth += 1
+            elif value in closing:
+                depth -= 1
+                if depth == 0:
+                    return i
+        i += step
+    return -1
+
+
+def _parse_chunk_map(tokens: List[Token], start: int) -> Tuple[dict, int]:
+    """Parse `{key:"value",...}` starting at tokens[start]; return (map, index of '}') or ({}, -1)"""
+    mapping = {}
+    i = start + 1
+    while i + 2 < len(tokens):
+        key_kind, key = tokens[i]
+        if key_kind not in (NUMBER, STRING, NAME) or tokens[i + 1] != (PUNCT, ':') or tokens[i + 2][0] != STRING:
+            return {}, -1
+        if key_kind == STRING:
+            key = _unquote(key)
+        mapping[key] = _unquote(tokens[i + 2][1])
+        i += 3
+        if tokens[i:i + 1] == [(PUNCT, ',')]:
+            i += 1
+        elif tokens[i:i + 1] == [(PUNCT, '}')]:
+            return mapping, i
+        else:
+            return {}, -1
+    return {}, -1
+
+
+def _operand_bounds(tokens: List[Token], end: int) -> int:
+    """Return the start index of the concatenation operand that ends at tokens[end], or -1"""
+    kind, value = tokens[end]
+    if kind in (STRING, NUMBER):
+        return end
+    if kind == PUNCT and value in (')', ']'):
+        start = _skip_group(tokens, end, -1)
+        if start <= 0:
+            return start
+        # `{...}[e]` or `obj[e]` / `fn(e)`
+        before = tokens[start - 1]
+        if before == (PUNCT, '}'):
+            return _skip_group(tokens, start - 1, -1)
+        if before[0] == NAME:
+            return _operand_bounds(tokens, start - 1)
+        return start
+    if kind == NAME:
+        i = end
+        while i >= 2 and tokens[i - 1] == (PUNCT, '.') and tokens[i - 2][0] == NAME:
+            i -= 2
+        return i
+    return -1
+
+
+def _evaluate_operand(tokens: List[Token], key: str) -> str:
+    """Evaluate one operand of a chunk URL concatenation for the given chunk id"""
+    kind, value = tokens[0]
+    if kind == STRING:
+        return _unquote(value)
+    if kind == NUMBER:
+        return value
+    if tokens[0] == (PUNCT, '{'):
+        mapping, close = _parse_chunk_map(tokens, 0)
+        if close >= 0:
+            return mapping.get(key, key)
+    if kind == NAME and len(tokens) >= 3 and tokens[-2] == (PUNCT, '.') and tokens[-1] == (NAME, 'p'):
+        # webpack public path (`__webpack_require__.p`) - resolved against the page
+        return ''
+    if tokens[0] == (PUNCT, '('):
+        # `({1:"vendors"}[e]||e)` style name lookups
+        for i, token in enumerate(tokens):
+            if token == (PUNCT, '{'):
+                mapping, close = _parse_chunk_map(tokens, i)
+                if close >= 0:
+                    return mapping.get(key, key)
+    return key
+
+
+def _expand_chunk_map(tokens: List[Token], open_index: int) -> Set[str]:
+    """Expand a `... + {id:"hash"}[e] + ".js"` concatenation into one path per chunk id"""
+    mapping, close = _parse_chunk_map(tokens, open_index)
+    if close < 0 or not mapping:
+        return set()
+    if tokens[close + 1:close + 2] != [(PUNCT, '[')]:
+        return set()
+    index_close = _skip_group(tokens, close + 1, 1)
+    if index_close < 0:
+        return set()
+
+    operands = [(open_index, index_close)]
+
+    # Walk left across `operand +`
+    i = open_index - 1
+    while i >= 1 and tokens[i] == (PUNCT, '+'):
+        start = _operand_bounds(tokens, i - 1)
+        if start < 0:
+            break
+        operands.insert(0, (start, i - 1))
+        i = start - 1
+
+    # Walk right across `+ operand`
+    i = index_close + 1
+    while i + 1 < len(tokens) and tokens[i] == (PUNCT, '+'):
+        kind, value = tokens[i + 1]
+        if kind in (STRING, NUMBER):
+            end = i + 1
+        elif kind == PUNCT and value in '([{':
+            end = _skip_group(tokens, i + 1, 1)
+            if end >= 0 and value == '{' and tokens[end + 1:end + 2] == [(PUNCT, '[')]:
+                end = _skip_group(tokens, end + 1, 1)
+        elif kind == NAME:
+            end = i + 1
+            while end + 2 < len(tokens) and tokens[end + 1] == (PUNCT, '.') and tokens[end + 2][0] == NAME:
+                end += 2
+        else:
+            break
+        if end < 0:
+            break
+        operands.append((i + 1, end))
+        i = end + 1
+
+    # A chunk URL must end in a literal script suffix
+    last_kind, last_value = tokens[operands[-1][1]]
+    if last_kind != STRING or not _SCRIPT_PATH.search(_unquote(last_value)):
+        return set()
+
+    paths = set()
+    for key in mapping:
+        path = ''.join(_evaluate_operand(tokens[start:end + 1], key) for start, end in operands)
+        if path:
+            paths.add(path)
+    return paths
+
+
+def find_script_dependencies(source: str) -> Set[str]:
+    """Return the raw script specifiers referenced by a JavaScript source"""
+    if not _TRIGGER.search(source):
+        return set()
+
+    tokens = tokenize_js(source)
+    specifiers: Set[str] = set()
+    count = len(tokens)
+
+    for i, (kind, value) in enumerate(tokens):
+        if kind == NAME:
+            previous = tokens[i - 1] if i else (None, None)
+            following = tokens[i + 1] if i + 1 < count else (None, None)
+
+            # import 'x' / import x from 'x' / export {x} from 'x'
+            if value == 'import' and following[0] == STRING:
+                specifiers.add(_unquote(following[1]))
+            elif value == 'from' and following[0] == STRING and previous != (PUNCT, '.'):
+                specifiers.add(_unquote(following[1]))
+
+            # loadScript('x'), import('x'), importScripts('a', 'b')
+            elif value in LOADER_NAMES and following == (PUNCT, '('):
+                j = i + 2
+                while j < count and tokens[j][0] == STRING:
+                    specifiers.add(_unquote(tokens[j][1]))
+                    if value != 'importScripts' or tokens[j + 1:j + 2] != [(PUNCT, ',')]:
+                        break
+                    j += 2
+
+            # script.src = 'x'
+            elif value == 'src' and previous == (PUNCT, '.') and following == (PUNCT, '='):
+                if i + 2 < count and tokens[i + 2][0] == STRING:
+                    specifiers.add(_unquote(tokens[i + 2][1]))
+
+            # script.setAttribute('src', 'x')
+            elif value == 'setAttribute' and following == (PUNCT, '(') and i + 4 < count:
+                if (tokens[i + 2][0] == STRING and _unquote(tokens[i + 2][1]).lower() == 'src'
+                        and tokens[i + 3] == (PUNCT, ',') and tokens[i + 4][0] == STRING):
+                    specifiers.add(_unquote(tokens[i + 4][1]))
+
+        elif kind == PUNCT and value == '{' and i + 3 < count and tokens[i + 2] == (PUNCT, ':'):
+            specifiers.update(_expand_chunk_map(tokens, i))
+
+    return {spec for spec in specifiers if _is_script_specifier(spec)}
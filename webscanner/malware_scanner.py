@@ -6,51 +6,478 @@ Scans through all links, scripts, and resources to identify polyfill.io usage.
 """
 
 import requests
+import urllib3
 import re
-import urllib.parse
+import hashlib
+import io
+import mmap
+import os
+import zlib
 import argparse
 import json
+import sys
 import time
-from typing import Set, List, Dict, Tuple
+import threading
+import heapq
+import itertools
+import xml.etree.ElementTree as ET
+from typing import Set, List, Dict, Tuple, Iterator, Iterable, TextIO
+from collections import Counter
+from contextlib import nullcontext
 from urllib.robotparser import RobotFileParser
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
 import logging
-from dataclasses import dataclass
+from array import array
 from datetime import datetime
+from js_deps import find_script_dependencies
+from url_model import host_of, parse_url
+from memory_budget import MemoryBudget, SeenUrls, SpillFrontier, current_rss
+from findings_db import FindingsDatabase
+from warc_archive import WarcWriter, WarcReader
+from scan_profiler import PROFILE_MODES, ScanProfiler
+from scan_logging import DEFAULT_LOG_FILE, configure_logging, configure_worker_logging, worker_logging_config
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('polyfill_scan.log'),
-        logging.StreamHandler()
-    ]
-)
+# Optional decoders for brotli and zstd transfer encodings
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+# Without output_buffer_limit (brotli < 1.2, brotlicffi) one call can inflate without bound
+if brotli is not None and not hasattr(brotli.Decompressor, 'can_accept_more_data'):
+    brotli = None
+
+# Errors raised by the decoders on a corrupt body
+DECODE_ERRORS: Tuple[type, ...] = (ValueError, zlib.error)
+if brotli is not None:
+    DECODE_ERRORS += (brotli.error,)
+if zstandard is not None:
+    DECODE_ERRORS += (zstandard.ZstdError,)
+
+# Logging is configured by main(); importing the scanner as a library adds no handlers
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Known severities, in report order
+SEVERITIES = ('HIGH', 'MEDIUM', 'LOW')
+
+# File types scanned by default in local directory mode
+LOCAL_EXTENSIONS = ('.html', '.htm', '.js', '.mjs', '.cjs', '.jsx', '.ts', '.tsx', '.vue', '.php', '.aspx', '.cshtml', '.json')
+LOCAL_SKIP_DIRS = {'.git', '.svn', '.hg'}
+
+# Paths treated as scripts when ordering the crawl frontier
+SCRIPT_EXTENSIONS = ('.js', '.mjs', '.cjs')
+
+# Decoded body size cap, guarding against decompression bombs
+DEFAULT_MAX_BODY_BYTES = 50 * 1024 * 1024
+
+# Bytes per megabyte, for --memory-budget and the RSS report lines
+MB = 1024 * 1024
+
+# Redirect statuses that are safe to cache for the rest of the run
+PERMANENT_REDIRECTS = {301, 308}
+MAX_REDIRECT_HOPS = 10
+
+
 class ScanResult:
-    """Data class to store scan results"""
-    url: str
-    threat_type: str
-    description: str
-    severity: str
-    details: str = ""
-    timestamp: str = ""
+    """Compact scan result; repeated strings are interned and timestamps kept as epoch nanoseconds"""
+    __slots__ = ('url', 'threat_type', 'description', 'severity', 'details', 'timestamp_ns')
+    
+    def __init__(self, url: str, threat_type: str, description: str, severity: str,
+                 details: str = "", timestamp_ns: int = 0):
+        self.url = url
+        self.threat_type = sys.intern(threat_type)
+        self.description = sys.intern(description)
+        self.severity = sys.intern(severity)
+        self.details = details
+        self.timestamp_ns = timestamp_ns or time.time_ns()
+    
+    @property
+    def timestamp(self) -> str:
+        """ISO 8601 timestamp in local time"""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9).isoformat()
+    
+    def __eq__(self, other):
+        if not isinstance(other, ScanResult):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+    
+    def __repr__(self):
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"ScanResult({fields})"
+
+
+class ResultStore:
+    """Columnar, array-backed store of scan results with shared string tables"""
+    
+    def __init__(self, results: Iterable[ScanResult] = ()):
+        self._lock = threading.Lock()
+        self._strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+        self._urls = array('I')
+        self._types = array('I')
+        self._descriptions = array('I')
+        self._severities = array('I')
+        self._timestamps = array('q')
+        self._details: List[str] = []
+        self.extend(results)
+    
+    def _string_id(self, value: str) -> int:
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = len(self._strings)
+            self._strings.append(value)
+            self._string_ids[value] = string_id
+        return string_id
+    
+    def append(self, result: ScanResult):
+        """Add a result (thread-safe)"""
+        with self._lock:
+            self._urls.append(self._string_id(result.url))
+            self._types.append(self._string_id(result.threat_type))
+            self._descriptions.append(self._string_id(result.description))
+            self._severities.append(self._string_id(result.severity))
+            self._timestamps.append(result.timestamp_ns)
+            self._details.append(result.details)
+    
+    def extend(self, results: Iterable[ScanResult]):
+        """Add several results"""
+        for result in results:
+            self.append(result)
+    
+    def _row(self, index: int) -> ScanResult:
+        strings = self._strings
+        return ScanResult(
+            url=strings[self._urls[index]],
+            threat_type=strings[self._types[index]],
+            description=strings[self._descriptions[index]],
+            severity=strings[self._severities[index]],
+            details=self._details[index],
+            timestamp_ns=self._timestamps[index]
+        )
+    
+    def __len__(self) -> int:
+        return len(self._details)
+    
+    def __getitem__(self, index: int) -> ScanResult:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("result index out of range")
+        return self._row(index)
+    
+    def __iter__(self) -> Iterator[ScanResult]:
+        for index in range(len(self)):
+            yield self._row(index)
+    
+    def count_by_severity(self) -> Dict[str, int]:
+        """Count results per severity without materializing them"""
+        counts = {}
+        for string_id in set(self._severities):
+            counts[self._strings[string_id]] = self._severities.count(string_id)
+        return counts
+    
+    def iter_severity(self, severity: str) -> Iterator[ScanResult]:
+        """Yield the results with the given severity, in insertion order"""
+        string_id = self._string_ids.get(severity)
+        if string_id is None:
+            return
+        for index, value in enumerate(self._severities):
+            if value == string_id:
+                yield self._row(index)
+    
+    def to_columns(self) -> Dict[str, list]:
+        """Return the results as a dict of equal-length column lists"""
+        strings = self._strings
+        return {
+            'url': [strings[i] for i in self._urls],
+            'threat_type': [strings[i] for i in self._types],
+            'description': [strings[i] for i in self._descriptions],
+            'severity': [strings[i] for i in self._severities],
+            'details': list(self._details),
+            'timestamp_ns': list(self._timestamps),
+        }
+    
+    def export_parquet(self, output_file: str):
+        """Export results to a Parquet file (requires pyarrow)"""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Parquet export requires pyarrow (pip install pyarrow)")
+        
+        columns = self.to_columns()
+        table = pa.table({
+            'url': pa.array(columns['url']).dictionary_encode(),
+            'threat_type': pa.array(columns['threat_type']).dictionary_encode(),
+            'description': pa.array(columns['description']).dictionary_encode(),
+            'severity': pa.array(columns['severity']).dictionary_encode(),
+            'details': pa.array(columns['details'], pa.string()),
+            'timestamp': pa.array(columns['timestamp_ns'], pa.timestamp('ns')),
+        })
+        pq.write_table(table, output_file)
+
+def supported_encodings() -> List[str]:
+    """Content-Encodings this scanner can decode, in preference order"""
+    encodings = []
+    if zstandard is not None:
+        encodings.append('zstd')
+    if brotli is not None:
+        encodings.append('br')
+    encodings.extend(['gzip', 'deflate'])
+    return encodings
+
+
+class ChunkReader:
+    """Minimal file object over an iterable of byte chunks, for decoders that pull their input"""
+    
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._buffer = b''
+    
+    def read(self, size: int = -1) -> bytes:
+        if not self._buffer:
+            self._buffer = next(self._chunks, b'')
+        if size < 0 or size >= len(self._buffer):
+            data, self._buffer = self._buffer, b''
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+class ContentDecoder:
+    """Incremental decoder for a single Content-Encoding, producing bounded output pieces"""
+    
+    PIECE = 65536  # output per decompressor call (brotli may overshoot by one internal buffer)
+    
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding in ('gzip', 'x-gzip'):
+            self._zlib = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif encoding == 'deflate':
+            self._zlib = None  # zlib-wrapped or raw, decided on the first bytes
+        elif encoding == 'br' and brotli is not None:
+            self._brotli = brotli.Decompressor()
+        elif encoding == 'zstd' and zstandard is not None:
+            pass
+        else:
+            raise ValueError(f"Unsupported content encoding: {encoding}")
+    
+    def decode(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Decode a stream of encoded chunks into pieces of at most PIECE bytes"""
+        if self.encoding == 'zstd':
+            # The reader pulls input only as needed to produce the next PIECE bytes
+            reader = zstandard.ZstdDecompressor().stream_reader(ChunkReader(chunks), read_across_frames=True)
+            while True:
+                piece = reader.read(self.PIECE)
+                if not piece:
+                    return
+                yield piece
+        
+        head = b''
+        for data in chunks:
+            if self.encoding == 'br':
+                # A call stops once its output reaches PIECE; drain with empty input until one falls short
+                piece = self._brotli.process(data, output_buffer_limit=self.PIECE)
+                while True:
+                    if piece:
+                        yield piece
+                    if len(piece) < self.PIECE and self._brotli.can_accept_more_data():
+                        break
+                    piece = self._brotli.process(b'', output_buffer_limit=self.PIECE)
+                continue
+            
+            if self._zlib is None:
+                # Servers send both zlib-wrapped and raw deflate streams; the first two bytes tell them apart
+                head += data
+                if len(head) < 2:
+                    continue
+                data, head = head, b''
+                self._zlib = zlib.decompressobj(self._deflate_wbits(data))
+            yield from self._inflate(data)
+        
+        if self.encoding == 'br':
+            return
+        if self._zlib is None:
+            # A deflate body shorter than two bytes
+            self._zlib = zlib.decompressobj(self._deflate_wbits(head))
+            yield from self._inflate(head)
+        tail = self._zlib.flush()
+        if tail:
+            yield tail
+    
+    @staticmethod
+    def _deflate_wbits(head: bytes) -> int:
+        is_zlib = len(head) >= 2 and (head[0] & 0x0F) == 8 and int.from_bytes(head[:2], 'big') % 31 == 0
+        return zlib.MAX_WBITS if is_zlib else -zlib.MAX_WBITS
+    
+    def _inflate(self, data: bytes) -> Iterator[bytes]:
+        while data:
+            piece = self._zlib.decompress(data, self.PIECE)
+            data = self._zlib.unconsumed_tail
+            if piece:
+                yield piece
+
+
+def iter_decoded(raw_chunks: Iterable[bytes], encodings: List[str]) -> Iterator[bytes]:
+    """Undo a Content-Encoding list (e.g. 'gzip, br') chunk by chunk"""
+    stream = iter(raw_chunks)
+    for encoding in reversed(encodings):
+        stream = ContentDecoder(encoding).decode(stream)
+    return stream
+
+
+class ScanMetrics:
+    """Thread-safe crawl metrics: wire vs. decoded bytes, overall and per target host"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.responses = 0
+        self.wire_bytes = 0
+        self.decoded_bytes = 0
+        self.oversized = 0
+        self.by_host: Dict[str, List[int]] = {}
+        self.rss = 0
+        self.peak_rss = 0
+        self.frontier_spilled = 0
+        self.body_waits = 0
+    
+    def add_transfer(self, url: str, wire_bytes: int, decoded_bytes: int, oversized: bool = False):
+        host = host_of(url)
+        with self._lock:
+            self.responses += 1
+            self.wire_bytes += wire_bytes
+            self.decoded_bytes += decoded_bytes
+            self.oversized += int(oversized)
+            totals = self.by_host.setdefault(host, [0, 0])
+            totals[0] += wire_bytes
+            totals[1] += decoded_bytes
+
+    def record_memory(self, rss: int):
+        """Note the current resident set size; None (unsupported platform) is ignored"""
+        if rss is None:
+            return
+        with self._lock:
+            self.rss = rss
+            self.peak_rss = max(self.peak_rss, rss)
+
+    def snapshot(self) -> dict:
+        """Return the counters as a plain (picklable) dict"""
+        with self._lock:
+            return {
+                'responses': self.responses,
+                'wire_bytes': self.wire_bytes,
+                'decoded_bytes': self.decoded_bytes,
+                'oversized': self.oversized,
+                'peak_rss': self.peak_rss,
+                'frontier_spilled': self.frontier_spilled,
+                'body_waits': self.body_waits,
+                'by_host': {host: list(totals) for host, totals in self.by_host.items()},
+            }
+
+    def merge(self, snapshot: dict):
+        """Add the counters of another process's snapshot()"""
+        with self._lock:
+            self.responses += snapshot['responses']
+            self.wire_bytes += snapshot['wire_bytes']
+            self.decoded_bytes += snapshot['decoded_bytes']
+            self.oversized += snapshot['oversized']
+            self.peak_rss = max(self.peak_rss, snapshot['peak_rss'])
+            self.frontier_spilled += snapshot['frontier_spilled']
+            self.body_waits += snapshot['body_waits']
+            for host, (wire, decoded) in snapshot['by_host'].items():
+                totals = self.by_host.setdefault(host, [0, 0])
+                totals[0] += wire
+                totals[1] += decoded
+
+    def write(self, fh: TextIO):
+        """Write the metrics section of the report"""
+        if not self.responses:
+            return
+        saved = self.decoded_bytes - self.wire_bytes
+        fh.write("SCAN METRICS:\n")
+        fh.write("-" * 40 + "\n")
+        fh.write(f"Responses Downloaded: {self.responses}\n")
+        fh.write(f"Wire Bytes: {self.wire_bytes}\n")
+        fh.write(f"Decoded Bytes: {self.decoded_bytes}\n")
+        fh.write(f"Compression Savings: {saved} bytes\n")
+        if self.oversized:
+            fh.write(f"Bodies Truncated At Size Cap: {self.oversized}\n")
+        if self.peak_rss:
+            fh.write(f"Memory (RSS): {self.rss / MB:.1f} MB at end, {self.peak_rss / MB:.1f} MB peak\n")
+        if self.frontier_spilled:
+            fh.write(f"Frontier Entries Spilled To Disk: {self.frontier_spilled}\n")
+        if self.body_waits:
+            fh.write(f"Downloads Held Back By Memory Budget: {self.body_waits}\n")
+        for host, (wire, decoded) in sorted(self.by_host.items()):
+            fh.write(f"{host}: {wire} wire / {decoded} decoded bytes\n")
+        fh.write("\n")
+
+
+class ReportCounters:
+    """Running finding counters, updated as results are produced during the crawl"""
+    
+    def __init__(self, results: Iterable[ScanResult] = ()):
+        self._lock = threading.Lock()
+        self.total = 0
+        self.by_severity: Counter = Counter()
+        self.by_domain: Counter = Counter()
+        self.by_url: Counter = Counter()
+        self.fetches = 0
+        self.record(results)
+    
+    def record(self, results: Iterable[ScanResult]):
+        """Count a batch of results (thread-safe)"""
+        for result in results:
+            domain = host_of(result.url)
+            with self._lock:
+                self.total += 1
+                self.by_severity[result.severity] += 1
+                self.by_domain[domain] += 1
+                self.by_url[result.url] += 1
+    
+    def record_fetch(self):
+        """Count a page or script that was actually requested (thread-safe)"""
+        with self._lock:
+            self.fetches += 1
+
 
 class PolyfillScanner:
     """Polyfill.io detection scanner class"""
     
-    def __init__(self, max_workers: int = 5, delay: float = 1.0, bypass_robots: bool = False):
+    def __init__(self, max_workers: int = 5, delay: float = 1.0, bypass_robots: bool = False,
+                 findings_db: FindingsDatabase = None, recorder: WarcWriter = None,
+                 max_body_bytes: int = DEFAULT_MAX_BODY_BYTES, memory_budget: MemoryBudget = None):
         self.max_workers = max_workers
         self.delay = delay
         self.bypass_robots = bypass_robots
         self.visited_urls: Set[str] = set()
-        self.scan_results: List[ScanResult] = []
+        self.scan_results = ResultStore()
+        self.script_graph: Dict[str, Set[str]] = {}
+        self.counters = ReportCounters()
+        self.findings_db = findings_db
+        self.run_id = None
+        self.recorder = recorder
+        self.files_scanned = None
+        self.sample_estimates = None  # set by sampling crawls; writes its own report section
+        self.redirect_cache: Dict[str, str] = {}
+        self._redirect_lock = threading.Lock()
+        self.max_body_bytes = max_body_bytes
+        self.memory_budget = memory_budget
+        self.metrics = ScanMetrics()
+        self.robots_cache: Dict[str, RobotFileParser] = {}
+        self.on_results = None  # optional callback(List[ScanResult]) for streaming findings
+        self.on_page = None  # optional callback(url, status_code, content_type) after each page is fetched
+        self.cancel_event = threading.Event()  # set to stop queued fetches and abort in-flight downloads
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept-Encoding': ', '.join(supported_encodings())
         })
         
         # Polyfill.io detection patterns only
@@ -71,48 +498,65 @@ class PolyfillScanner:
         }
         
 
+    def copy_engine(self) -> 'PolyfillScanner':
+        """Return a scanner with fresh crawl state that shares this one's session, caches and signatures"""
+        clone = PolyfillScanner(max_workers=self.max_workers, delay=self.delay, bypass_robots=self.bypass_robots,
+                                findings_db=self.findings_db, recorder=self.recorder,
+                                max_body_bytes=self.max_body_bytes, memory_budget=self.memory_budget)
+        clone.session.close()
+        clone.session = self.session
+        clone.robots_cache = self.robots_cache
+        clone.redirect_cache = self.redirect_cache
+        clone._redirect_lock = self._redirect_lock
+        clone.threat_patterns = self.threat_patterns
+        clone.malicious_domains = self.malicious_domains
+        clone._byte_matcher_cache = self._byte_matchers()
+        clone._byte_matcher_key = self._byte_matcher_key
+        return clone
+
     def is_valid_url(self, url: str) -> bool:
         """Check if URL is valid and should be scanned"""
-        try:
-            parsed = urllib.parse.urlparse(url)
-            return parsed.scheme in ['http', 'https'] and parsed.netloc
-        except:
-            return False
+        parsed = parse_url(url)
+        return parsed is not None and parsed.is_http
 
     def normalize_url(self, url: str, base_url: str = None) -> str:
         """Normalize URL for consistent processing"""
-        try:
-            if base_url and not url.startswith(('http://', 'https://')):
-                url = urllib.parse.urljoin(base_url, url)
-            
-            parsed = urllib.parse.urlparse(url)
-            # Remove fragment and normalize
-            normalized = urllib.parse.urlunparse((
-                parsed.scheme, parsed.netloc, parsed.path,
-                parsed.params, parsed.query, ''
-            ))
-            return normalized
-        except:
-            return url
+        parsed = parse_url(url, base_url)
+        return parsed.url if parsed else url
+
+    def _link(self, raw: str, base_url: str) -> str:
+        """Canonical form of a discovered link, or '' if it is not a crawlable http(s) URL"""
+        parsed = parse_url(raw, base_url)
+        return parsed.url if parsed is not None and parsed.is_http else ''
 
     def can_fetch(self, url: str) -> bool:
         """Check robots.txt to see if we can fetch the URL"""
         if self.bypass_robots:
-            logger.debug(f"Bypassing robots.txt check for {url}")
+            logger.debug(f"Bypassing robots.txt check for {url}", extra={'url': url})
             return True
         
-        try:
-            parsed = urllib.parse.urlparse(url)
-            robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
-            rp = RobotFileParser()
-            rp.set_url(robots_url)
-            rp.read()
-            can_fetch = rp.can_fetch('*', url)
-            if not can_fetch:
-                logger.debug(f"robots.txt blocks access to {url}")
-            return can_fetch
-        except:
-            return True  # If we can't check robots.txt, assume we can fetch
+        parsed = parse_url(url)
+        if parsed is None:
+            return False
+        robots_url = f"{parsed.origin}/robots.txt"
+        
+        # robots.txt is read once per host and reused for the rest of the run
+        rp = self.robots_cache.get(robots_url, False)
+        if rp is False:
+            try:
+                rp = RobotFileParser()
+                rp.set_url(robots_url)
+                rp.read()
+            except:
+                rp = None  # If we can't check robots.txt, assume we can fetch
+            self.robots_cache[robots_url] = rp
+        
+        if rp is None:
+            return True
+        can_fetch = rp.can_fetch('*', url)
+        if not can_fetch:
+            logger.debug(f"robots.txt blocks access to {url}", extra={'url': url})
+        return can_fetch
 
     def extract_links(self, content: str, base_url: str) -> Set[str]:
         """Extract all links from HTML content"""
@@ -121,33 +565,44 @@ class PolyfillScanner:
         # Extract href attributes
         href_pattern = r'href=["\']([^"\']+)["\']'
         for match in re.finditer(href_pattern, content, re.IGNORECASE):
-            link = self.normalize_url(match.group(1), base_url)
-            if self.is_valid_url(link):
-                links.add(link)
+            links.add(self._link(match.group(1), base_url))
         
         # Extract src attributes
         src_pattern = r'src=["\']([^"\']+)["\']'
         for match in re.finditer(src_pattern, content, re.IGNORECASE):
-            link = self.normalize_url(match.group(1), base_url)
-            if self.is_valid_url(link):
-                links.add(link)
+            links.add(self._link(match.group(1), base_url))
         
         # Extract action attributes (forms)
         action_pattern = r'action=["\']([^"\']+)["\']'
         for match in re.finditer(action_pattern, content, re.IGNORECASE):
-            link = self.normalize_url(match.group(1), base_url)
-            if self.is_valid_url(link):
-                links.add(link)
+            links.add(self._link(match.group(1), base_url))
         
         # Extract URLs from JavaScript
         js_url_pattern = r'["\'](https?://[^"\']+)["\']'
         for match in re.finditer(js_url_pattern, content, re.IGNORECASE):
-            link = match.group(1)
-            if self.is_valid_url(link):
-                links.add(link)
+            links.add(self._link(match.group(1), base_url))
+        
+        # Extract scripts loaded dynamically by inline <script> blocks
+        inline_pattern = r'<script\b[^>]*>(.*?)</script>'
+        for match in re.finditer(inline_pattern, content, re.IGNORECASE | re.DOTALL):
+            if match.group(1).strip():
+                links.update(self.extract_script_dependencies(match.group(1), base_url))
         
+        links.discard('')
         return links
 
+    def extract_script_dependencies(self, content: str, base_url: str) -> Set[str]:
+        """Extract scripts loaded by JavaScript (imports, loaders, injected tags, webpack chunks)"""
+        dependencies = set()
+        for specifier in find_script_dependencies(content):
+            link = self._link(specifier, base_url)
+            if link:
+                dependencies.add(link)
+        
+        if dependencies:
+            self.script_graph.setdefault(base_url, set()).update(dependencies)
+        return dependencies
+
     def scan_content(self, content: str, url: str) -> List[ScanResult]:
         """Scan content for malware patterns"""
         results = []
@@ -162,8 +617,7 @@ class PolyfillScanner:
                     threat_type=threat_name,
                     description=threat_info['description'],
                     severity=threat_info['severity'],
-                    details=f"Found at position {match.start()}: {match.group(0)[:100]}",
-                    timestamp=datetime.now().isoformat()
+                    details=f"Found at position {match.start()}: {match.group(0)[:100]}"
                 )
                 results.append(result)
         
@@ -175,64 +629,356 @@ class PolyfillScanner:
                     threat_type='malicious_domain',
                     description=f'Reference to known malicious domain: {domain}',
                     severity='HIGH',
-                    details=f'Domain "{domain}" found in content',
-                    timestamp=datetime.now().isoformat()
+                    details=f'Domain "{domain}" found in content'
                 )
                 results.append(result)
         
         return results
 
-    def fetch_url(self, url: str) -> Tuple[str, str, int]:
-        """Fetch URL content and return content, content_type, and status_code"""
+    def _byte_matchers(self) -> Tuple[list, re.Pattern]:
+        """Return compiled bytes regexes for threat_patterns and malicious_domains (rebuilt if either changes)"""
+        key = (tuple((name, info['pattern']) for name, info in self.threat_patterns.items()),
+               tuple(sorted(self.malicious_domains)))
+        if getattr(self, '_byte_matcher_key', None) != key:
+            patterns = [
+                (name, info, re.compile(info['pattern'].encode('ascii'), re.IGNORECASE | re.MULTILINE))
+                for name, info in self.threat_patterns.items()
+            ]
+            domains = re.compile(
+                b'|'.join(re.escape(domain.encode('ascii')) for domain in key[1]) or b'(?!)',
+                re.IGNORECASE
+            )
+            self._byte_matcher_cache = (patterns, domains)
+            self._byte_matcher_key = key
+        return self._byte_matcher_cache
+
+    def _pattern_result(self, url: str, threat_name: str, threat_info: dict, position: int,
+                        matched: bytes) -> ScanResult:
+        # Only the reported context window is ever decoded
+        text = matched[:100].decode('utf-8', 'replace')
+        return ScanResult(
+            url=url,
+            threat_type=threat_name,
+            description=threat_info['description'],
+            severity=threat_info['severity'],
+            details=f"Found at position {position}: {text}"
+        )
+
+    def _domain_results(self, url: str, found: Set[str]) -> List[ScanResult]:
+        return [
+            ScanResult(
+                url=url,
+                threat_type='malicious_domain',
+                description=f'Reference to known malicious domain: {domain}',
+                severity='HIGH',
+                details=f'Domain "{domain}" found in content'
+            )
+            for domain in self.malicious_domains if domain in found
+        ]
+
+    def scan_bytes(self, data: bytes, url: str) -> List[ScanResult]:
+        """Scan raw response bytes case-insensitively, without decoding the body"""
+        patterns, domains = self._byte_matchers()
+        results = []
+        
+        for threat_name, threat_info, pattern in patterns:
+            for match in pattern.finditer(data):
+                results.append(self._pattern_result(url, threat_name, threat_info, match.start(), match.group(0)))
+        
+        found = {match.group(0).decode('ascii').lower() for match in domains.finditer(data)}
+        results.extend(self._domain_results(url, found))
+        return results
+
+    def scan_chunks(self, chunks: Iterable[bytes], url: str, overlap: int = 1024) -> List[ScanResult]:
+        """Scan a stream of byte chunks; matches shorter than `overlap` that span chunk boundaries are found"""
+        patterns, domains = self._byte_matchers()
+        results = []
+        found: Set[str] = set()
+        buffer = b''
+        offset = 0          # absolute position of buffer[0]
+        reported_upto = 0   # matches starting before this absolute position were already handled
+        
+        def scan_window(stop: int):
+            for threat_name, threat_info, pattern in patterns:
+                for match in pattern.finditer(buffer, max(0, reported_upto - offset)):
+                    if match.start() >= stop:
+                        break
+                    results.append(self._pattern_result(
+                        url, threat_name, threat_info, offset + match.start(), match.group(0)))
+            for match in domains.finditer(buffer, max(0, reported_upto - offset)):
+                if match.start() >= stop:
+                    break
+                found.add(match.group(0).decode('ascii').lower())
+        
+        for chunk in chunks:
+            if not chunk:
+                continue
+            buffer += chunk
+            safe_end = len(buffer) - overlap
+            if safe_end <= 0:
+                continue
+            scan_window(safe_end)
+            reported_upto = offset + safe_end
+            offset += safe_end
+            buffer = buffer[safe_end:]
+        
+        scan_window(len(buffer) + 1)
+        results.extend(self._domain_results(url, found))
+        return results
+
+    @staticmethod
+    def decode_content(data: bytes, content_type: str) -> str:
+        """Decode a body using its declared charset (UTF-8 otherwise) - never runs charset detection"""
+        match = re.search(r'charset=["\']?([\w.:-]+)', content_type)
+        encoding = match.group(1) if match else 'utf-8'
         try:
-            response = self.session.get(url, timeout=10, allow_redirects=True)
-            content_type = response.headers.get('content-type', '').lower()
-            
-            # Only process HTML and JavaScript content
-            if any(ct in content_type for ct in ['text/html', 'text/javascript', 'application/javascript', 'application/x-javascript']):
-                return response.text, content_type, response.status_code
-            else:
-                return '', content_type, response.status_code
+            return data.decode(encoding, 'replace')
+        except LookupError:
+            return data.decode('utf-8', 'replace')
+
+    @staticmethod
+    def is_scannable_type(content_type: str) -> bool:
+        """Only HTML and JavaScript content is scanned"""
+        return any(ct in content_type for ct in ['text/html', 'text/javascript', 'application/javascript', 'application/x-javascript'])
+
+    def resolve_redirects(self, url: str) -> str:
+        """Rewrite a URL through the cached permanent (301/308) redirects"""
+        for _ in range(MAX_REDIRECT_HOPS):
+            target = self.redirect_cache.get(url)
+            if target is None or target == url:
+                break
+            url = target
+        return url
+
+    def _record_redirects(self, url: str, response: requests.Response) -> str:
+        """Cache permanent hops of a redirect chain, mark intermediate hops visited and return the final URL"""
+        if not response.history:
+            return url
+        
+        chain = [self.normalize_url(hop.url) for hop in response.history] + [self.normalize_url(response.url)]
+        with self._redirect_lock:
+            for i, hop in enumerate(response.history):
+                if hop.status_code in PERMANENT_REDIRECTS:
+                    self.redirect_cache[chain[i]] = chain[i + 1]
+        self.visited_urls.update(chain[:-1])
+        return chain[-1]
+
+    def load_redirect_cache(self, path: str):
+        """Load permanent redirects saved by a previous run"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.redirect_cache.update(json.load(f))
+            logger.info(f"Loaded {len(self.redirect_cache)} cached redirects from {path}")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load redirect cache {path}: {e}")
+
+    def save_redirect_cache(self, path: str):
+        """Save permanent redirects for later runs"""
+        with self._redirect_lock:
+            data = dict(self.redirect_cache)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        logger.info(f"Saved {len(data)} cached redirects to {path}")
+
+    def iter_body(self, url: str, response: requests.Response) -> Iterator[bytes]:
+        """Stream a response body, decoding its Content-Encoding and enforcing the decoded size cap"""
+        encodings = [e.strip() for e in response.headers.get('content-encoding', '').lower().split(',')
+                     if e.strip() and e.strip() != 'identity']
+        wire_bytes = 0
+        decoded_bytes = 0
+        oversized = False
+        
+        def raw_chunks():
+            nonlocal wire_bytes
+            # Surface read failures as requests exceptions, as response.content would
+            try:
+                for chunk in response.raw.stream(65536, decode_content=False):
+                    wire_bytes += len(chunk)
+                    yield chunk
+            except urllib3.exceptions.ProtocolError as e:
+                raise requests.exceptions.ChunkedEncodingError(e) from e
+            except urllib3.exceptions.HTTPError as e:
+                raise requests.exceptions.ConnectionError(e) from e
+        
+        try:
+            for piece in iter_decoded(raw_chunks(), encodings):
+                if self.cancel_event.is_set():
+                    break
+                if decoded_bytes + len(piece) > self.max_body_bytes:
+                    piece = piece[:self.max_body_bytes - decoded_bytes]
+                    oversized = True
+                decoded_bytes += len(piece)
+                if piece:
+                    yield piece
+                if oversized:
+                    logger.warning(f"Truncated {url} at {self.max_body_bytes} decoded bytes")
+                    break
+        except DECODE_ERRORS as e:
+            logger.warning(f"Cannot decode {url}: {e}")
+        finally:
+            self.metrics.add_transfer(url, wire_bytes, decoded_bytes, oversized)
+
+    def fetch_and_scan(self, url: str, scan: bool = True, keep_body: bool = True, hash_body: bool = False,
+                       hold_body: bool = False) -> Tuple[List[ScanResult], bytes, str, int, str, str]:
+        """Fetch a URL and stream its decoded body through the chunked matcher.
+        
+        Returns (results, body, content_type, status_code, final_url, content_hash); body is
+        empty unless keep_body is set and content_hash is empty unless hash_body is set.
+        With hold_body, the returned body stays charged to the memory budget and the caller
+        releases len(body) once it is done with it.
+        """
+        keep_body = keep_body or self.recorder is not None
+        budget = self.memory_budget if keep_body else None
+        held = 0
+        handed_over = False
+        if budget:
+            budget.admit_body()
+        try:
+            with self.session.get(url, timeout=10, allow_redirects=True, stream=True) as response:
+                content_type = response.headers.get('content-type', '').lower()
+                final_url = self._record_redirects(url, response)
+                
+                # Only download HTML and JavaScript content
+                if not self.is_scannable_type(content_type):
+                    return [], b'', content_type, response.status_code, final_url, ''
+                
+                parts = []
+                hasher = hashlib.blake2b(digest_size=16) if hash_body else None
+                size = 0
+                
+                def tee(chunks):
+                    nonlocal size, held
+                    for chunk in chunks:
+                        size += len(chunk)
+                        if hasher:
+                            hasher.update(chunk)
+                        if keep_body:
+                            parts.append(chunk)
+                            if budget:
+                                budget.add_body(len(chunk))
+                                held += len(chunk)
+                        yield chunk
+                
+                chunks = tee(self.iter_body(final_url, response))
+                if scan:
+                    results = self.scan_chunks(chunks, final_url)
+                else:
+                    results = []
+                    for _ in chunks:
+                        pass
+                body = b''.join(parts)
+                
+                if self.recorder:
+                    # Record the response under the URL that served it, which its links resolve against
+                    self.recorder.write_response(final_url, response.status_code, response.reason,
+                                                 dict(response.headers), body)
+                content_hash = hasher.hexdigest() if hasher and size else ''
+                handed_over = hold_body
+                return results, body, content_type, response.status_code, final_url, content_hash
                 
         except requests.RequestException as e:
             logger.warning(f"Failed to fetch {url}: {e}")
-            return '', '', 0
+            return [], b'', '', 0, url, ''
+        finally:
+            if budget and not handed_over:
+                budget.release_body(held)
 
-    def scan_url(self, url: str, max_depth: int = 3, current_depth: int = 0) -> List[ScanResult]:
-        """Scan a single URL and its discovered links"""
-        if url in self.visited_urls or current_depth >= max_depth:
-            return []
+    def fetch_url_bytes(self, url: str) -> Tuple[bytes, str, int, str]:
+        """Fetch URL content and return raw body bytes, content_type, status_code and the final URL after redirects"""
+        _, data, content_type, status_code, final_url, _ = self.fetch_and_scan(url, scan=False)
+        return data, content_type, status_code, final_url
+
+    def fetch_url(self, url: str) -> Tuple[str, str, int]:
+        """Fetch URL content and return content, content_type, and status_code"""
+        data, content_type, status_code, _ = self.fetch_url_bytes(url)
+        return self.decode_content(data, content_type), content_type, status_code
+
+    def scan_page(self, url: str, max_depth: int = 3, current_depth: int = 0,
+                  link_limit: int = 20) -> Tuple[List[ScanResult], List[str]]:
+        """Scan a single URL without following links; return its results and the links to crawl next"""
+        url = self.resolve_redirects(url)
+        if url in self.visited_urls or current_depth >= max_depth or self.cancel_event.is_set():
+            return [], []
         
         if not self.can_fetch(url):
             if self.bypass_robots:
-                logger.debug(f"Bypassing robots.txt restrictions for {url}")
+                logger.debug(f"Bypassing robots.txt restrictions for {url}", extra={'url': url})
             else:
-                logger.info(f"Skipping {url} due to robots.txt restrictions")
-                return []
+                logger.info(f"Skipping {url} due to robots.txt restrictions", extra={'url': url})
+                return [], []
         
         self.visited_urls.add(url)
-        logger.info(f"Scanning {url} (depth {current_depth})")
+        logger.info(f"Scanning {url} (depth {current_depth})", extra={'url': url})
         
         # Add delay to be respectful
-        time.sleep(self.delay)
+        if self.cancel_event.wait(self.delay):
+            return [], []
         
         results = []
-        content, content_type, status_code = self.fetch_url(url)
-        
-        if not content:
-            return results
+        follow_links = current_depth < max_depth - 1
+        scan_results, data, content_type, status_code, final_url, content_hash = self.fetch_and_scan(
+            url, keep_body=follow_links, hash_body=self.findings_db is not None, hold_body=True
+        )
+        self.counters.record_fetch()
         
-        # Scan the content for threats
-        scan_results = self.scan_content(content, url)
-        results.extend(scan_results)
-        
-        # Extract and scan discovered links
-        if 'text/html' in content_type and current_depth < max_depth - 1:
-            links = self.extract_links(content, url)
+        # The body stays charged to the memory budget until its links have been extracted
+        try:
+            # Continue under the canonical name; skip it if another branch already scanned it
+            if final_url != url:
+                if final_url in self.visited_urls:
+                    logger.debug(f"{url} redirects to already scanned {final_url}", extra={'url': url})
+                    return results, []
+                self.visited_urls.add(final_url)
+                url = final_url
             
-            # Limit the number of links to scan to prevent infinite crawling
-            links_to_scan = list(links)[:20]  # Limit to first 20 links
+            if self.findings_db and self.run_id is not None:
+                self.findings_db.add_fetch(self.run_id, url, status_code, content_hash or None)
+            if self.on_page:
+                self.on_page(url, status_code, content_type)
             
+            # The body was matched chunk by chunk while streaming; it is only kept for link extraction
+            self.counters.record(scan_results)
+            if self.on_results and scan_results:
+                self.on_results(scan_results)
+            if self.findings_db and self.run_id is not None:
+                self.findings_db.add_findings(self.run_id, scan_results)
+            results.extend(scan_results)
+            
+            if not data or not follow_links:
+                return results, []
+            
+            # Extract discovered links
+            links = set()
+            if 'text/html' in content_type:
+                links = self.extract_links(self.decode_content(data, content_type), url)
+            elif 'javascript' in content_type:
+                links = self.extract_script_dependencies(self.decode_content(data, content_type), url)
+            
+            # Rewrite links through known permanent redirects and drop ones already scanned
+            links = {self.resolve_redirects(link) for link in links}
+            links.difference_update(self.visited_urls)
+            
+            # Limit the number of links to scan to prevent infinite crawling, keeping scripts first
+            ordered = sorted(links, key=lambda link: (self.link_priority(link, url), link))
+            return results, ordered[:link_limit] if link_limit else ordered
+        finally:
+            if self.memory_budget and data:
+                self.memory_budget.release_body(len(data))
+
+    def link_priority(self, link: str, page_url: str) -> int:
+        """Crawl order of a discovered link: 0 for scripts, 1 for pages and other resources"""
+        parsed = parse_url(link)
+        if parsed is not None and parsed.path.lower().endswith(SCRIPT_EXTENSIONS):
+            return 0
+        return 0 if link in self.script_graph.get(page_url, ()) else 1
+
+    def scan_url(self, url: str, max_depth: int = 3, current_depth: int = 0) -> List[ScanResult]:
+        """Scan a single URL and its discovered links"""
+        results, links_to_scan = self.scan_page(url, max_depth, current_depth)
+        
+        if links_to_scan:
             with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
                 future_to_url = {
                     executor.submit(self.scan_url, link, max_depth, current_depth + 1): link 
@@ -249,70 +995,479 @@ class PolyfillScanner:
         
         return results
 
-    def scan_website(self, start_url: str, max_depth: int = 2) -> List[ScanResult]:
-        """Main method to scan a website"""
+    def crawl_frontier(self, seeds: List[Tuple[str, int]], max_depth: int, keep_results: bool = True) -> ResultStore:
+        """Breadth-first crawl of (url, depth) seeds over one spillable frontier.
+        
+        With a memory budget, the frontier and the set of queued URLs spill to disk once RSS
+        passes the spill threshold, and while RSS is over the budget only one page is fetched
+        at a time until memory drains. visited_urls still grows with every page scanned.
+        Without keep_results, findings only reach counters, on_results and the findings database.
+        """
+        budget = self.memory_budget
+        frontier = budget.frontier() if budget else SpillFrontier()
+        queued = budget.seen_urls() if budget else SeenUrls()
+        results = ResultStore()
+        for url, depth in seeds:
+            if queued.add(url):
+                frontier.push(url, depth)
+        
+        throttled = False
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                pending = {}
+                while frontier or pending:
+                    over = False
+                    if budget:
+                        rss = current_rss()
+                        self.metrics.record_memory(rss)
+                        frontier.force_spill = queued.force_spill = budget.should_spill(rss)
+                        over = budget.over_budget(rss)
+                    if over and not throttled:
+                        logger.warning(f"RSS {rss / MB:.0f} MB is over the {budget.limit_bytes / MB:.0f} MB "
+                                       f"memory budget; fetching one page at a time")
+                    throttled = over
+                    
+                    limit = 1 if over else self.max_workers
+                    while frontier and len(pending) < limit:
+                        url, depth = frontier.pop()
+                        pending[executor.submit(self.scan_page, url, max_depth, depth)] = (url, depth)
+                    
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        url, depth = pending.pop(future)
+                        try:
+                            page_results, links = future.result()
+                        except Exception as e:
+                            logger.error(f"Error scanning {url}: {e}", extra={'url': url})
+                            continue
+                        if keep_results:
+                            results.extend(page_results)
+                        for link in links:
+                            if queued.add(link):
+                                frontier.push(link, depth + 1)
+        finally:
+            frontier.close()
+            queued.close()
+        
+        self.metrics.frontier_spilled += frontier.spilled_total
+        if budget:
+            self.metrics.body_waits = budget.body_waits
+        return results
+
+    def discover_sitemaps(self, start_url: str) -> List[str]:
+        """Find sitemap URLs from robots.txt Sitemap: lines, falling back to /sitemap.xml"""
+        root = parse_url(start_url).origin
+        sitemaps = []
+        
+        try:
+            response = self.session.get(f"{root}/robots.txt", timeout=10)
+            if response.status_code == 200:
+                for line in response.text.splitlines():
+                    if line.lower().startswith('sitemap:'):
+                        sitemap_url = self.normalize_url(line.split(':', 1)[1].strip(), root + '/')
+                        if self.is_valid_url(sitemap_url) and sitemap_url not in sitemaps:
+                            sitemaps.append(sitemap_url)
+        except requests.RequestException as e:
+            logger.debug(f"Could not read robots.txt for sitemaps: {e}")
+        
+        if not sitemaps:
+            sitemaps.append(f"{root}/sitemap.xml")
+        return sitemaps
+
+    def iter_sitemap(self, sitemap_url: str) -> Iterator[Tuple[str, str]]:
+        """Stream (kind, loc) pairs from a sitemap or sitemap index, where kind is 'url' or 'sitemap'"""
+        try:
+            response = self.session.get(sitemap_url, timeout=30, stream=True)
+        except requests.RequestException as e:
+            logger.warning(f"Failed to fetch sitemap {sitemap_url}: {e}")
+            return
+        
+        with response:
+            if response.status_code != 200:
+                logger.debug(f"Sitemap {sitemap_url} returned status {response.status_code}")
+                return
+            
+            # Content-Encoding is undone by requests; .xml.gz files are gzipped bodies
+            parser = ET.XMLPullParser(events=('start', 'end'))
+            decompressor = None
+            root = None
+            
+            try:
+                for chunk in response.iter_content(chunk_size=65536):
+                    if root is None and decompressor is None and chunk[:2] == b'\x1f\x8b':
+                        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                    while chunk:
+                        if decompressor:
+                            # Inflate in bounded pieces; gzipped sitemaps compress ~100x
+                            data = decompressor.decompress(chunk, 65536)
+                            chunk = decompressor.unconsumed_tail
+                        else:
+                            data, chunk = chunk, b''
+                        parser.feed(data)
+                        
+                        for event, elem in parser.read_events():
+                            if event == 'start':
+                                if root is None:
+                                    root = elem
+                                continue
+                            
+                            tag = elem.tag.rsplit('}', 1)[-1]
+                            if tag == 'loc' and elem.text:
+                                kind = 'sitemap' if root.tag.endswith('sitemapindex') else 'url'
+                                yield kind, elem.text.strip()
+                            elif tag in ('url', 'sitemap'):
+                                # Drop finished entries so large sitemaps stay flat in memory
+                                root.clear()
+                parser.close()
+            except (ET.ParseError, zlib.error, requests.RequestException) as e:
+                logger.warning(f"Failed to parse sitemap {sitemap_url}: {e}")
+
+    def seed_from_sitemaps(self, start_url: str, limit: int = 500, max_sitemaps: int = 50) -> List[str]:
+        """Collect same-host page URLs from the site's sitemaps to seed the crawl"""
+        host = host_of(start_url)
+        pending = self.discover_sitemaps(start_url)
+        seen_sitemaps = set()
+        seeds = []
+        seen_seeds = set()
+        
+        while pending and len(seen_sitemaps) < max_sitemaps and len(seeds) < limit:
+            sitemap_url = pending.pop(0)
+            if sitemap_url in seen_sitemaps:
+                continue
+            seen_sitemaps.add(sitemap_url)
+            logger.info(f"Reading sitemap {sitemap_url}")
+            
+            for kind, loc in self.iter_sitemap(sitemap_url):
+                link = self.normalize_url(loc, sitemap_url)
+                if not self.is_valid_url(link):
+                    continue
+                if kind == 'sitemap':
+                    if link not in seen_sitemaps:
+                        pending.append(link)
+                elif host_of(link) == host and link not in seen_seeds:
+                    seen_seeds.add(link)
+                    seeds.append(link)
+                    if len(seeds) >= limit:
+                        break
+        
+        logger.info(f"Seeded {len(seeds)} URLs from {len(seen_sitemaps)} sitemaps")
+        return seeds
+
+    def scan_website(self, start_url: str, max_depth: int = 2, use_sitemaps: bool = False,
+                     sitemap_limit: int = 500, keep_results: bool = True) -> ResultStore:
+        """Main method to scan a website; without keep_results findings are only streamed through on_results"""
         logger.info(f"Starting polyfill.io scan of {start_url}")
         
         if not self.is_valid_url(start_url):
             raise ValueError(f"Invalid URL: {start_url}")
         
-        results = self.scan_url(start_url, max_depth)
-        self.scan_results = results
+        self.counters = ReportCounters()
+        if self.findings_db:
+            self.run_id = self.findings_db.start_run(start_url)
         
-        logger.info(f"Scan completed. Found {len(results)} polyfill.io references.")
-        return results
+        if self.memory_budget or not keep_results:
+            # One flat, spillable frontier; sitemap URLs join it as if linked from the start page
+            seeds = [(start_url, 0)]
+            if use_sitemaps:
+                seed_depth = min(1, max_depth - 1)
+                seeds.extend((seed, seed_depth) for seed in self.seed_from_sitemaps(start_url, sitemap_limit))
+            self.scan_results = self.crawl_frontier(seeds, max_depth, keep_results)
+        else:
+            results = self.scan_url(start_url, max_depth)
+            
+            # Scan sitemap URLs as if they were linked from the start page
+            if use_sitemaps:
+                seeds = [seed for seed in self.seed_from_sitemaps(start_url, sitemap_limit)
+                         if seed not in self.visited_urls]
+                seed_depth = min(1, max_depth - 1)
+                
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    future_to_url = {
+                        executor.submit(self.scan_url, seed, max_depth, seed_depth): seed
+                        for seed in seeds
+                    }
+                    
+                    for future in as_completed(future_to_url):
+                        seed = future_to_url[future]
+                        try:
+                            results.extend(future.result())
+                        except Exception as e:
+                            logger.error(f"Error scanning {seed}: {e}")
+            
+            self.scan_results = ResultStore(results)
+        self.metrics.record_memory(current_rss())
+        
+        if self.findings_db:
+            self.findings_db.finish_run(self.run_id, len(self.visited_urls), len(self.scan_results))
+            self.run_id = None
+        
+        logger.info(f"Scan completed. Found {len(self.scan_results)} polyfill.io references.")
+        return self.scan_results
 
-    def generate_report(self, output_file: str = None) -> str:
-        """Generate a detailed scan report"""
+    def verdict_scan(self, start_url: str, max_depth: int = 2) -> dict:
+        """Settle whether a site references polyfill.io with as few requests as possible.
+        
+        The landing page is fetched first, then scripts before other pages. The crawl
+        stops at the first HIGH finding: queued fetches are dropped and in-flight
+        downloads are aborted through cancel_event.
+        """
+        if not self.is_valid_url(start_url):
+            raise ValueError(f"Invalid URL: {start_url}")
+        
+        logger.info(f"Starting polyfill.io verdict sweep of {start_url}")
+        started = time.perf_counter()
+        self.counters = ReportCounters()
+        self.cancel_event.clear()
+        start_url = self.resolve_redirects(start_url)
+        
+        # Only the landing page is in flight until it completes, so the first page reported is the landing page
+        landing_status = None
+        previous_on_page = self.on_page
+        
+        def on_page(url: str, status_code: int, content_type: str):
+            nonlocal landing_status
+            if landing_status is None:
+                landing_status = status_code
+            if previous_on_page:
+                previous_on_page(url, status_code, content_type)
+        
+        self.on_page = on_page
+        order = itertools.count()
+        frontier = [(0, 0, next(order), start_url)]  # (priority, depth, order, url)
+        queued = {start_url}
+        results = []
+        finding = None
+        time_to_verdict = None
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {}
+            while frontier or pending:
+                while frontier and len(pending) < self.max_workers:
+                    _, depth, _, url = heapq.heappop(frontier)
+                    pending[executor.submit(self.scan_page, url, max_depth, depth)] = (url, depth)
+                
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url, depth = pending.pop(future)
+                    try:
+                        page_results, links = future.result()
+                    except Exception as e:
+                        logger.error(f"Error scanning {url}: {e}", extra={'url': url})
+                        continue
+                    results.extend(page_results)
+                    
+                    if finding is None:
+                        finding = next((r for r in page_results if r.severity == 'HIGH'), None)
+                        if finding:
+                            time_to_verdict = time.perf_counter() - started
+                            self.cancel_event.set()
+                            frontier.clear()
+                            continue
+                        for link in links:
+                            if link not in queued:
+                                queued.add(link)
+                                heapq.heappush(frontier, (self.link_priority(link, url), depth + 1, next(order), link))
+        
+        self.on_page = previous_on_page
+        self.cancel_event.clear()
+        self.scan_results = ResultStore(results)
+        if time_to_verdict is None:
+            time_to_verdict = time.perf_counter() - started
+        
+        # Without a successfully fetched landing page, finding nothing proves nothing
+        if finding:
+            outcome, description = 'dirty', finding.description
+        elif landing_status is None:
+            outcome, description = 'error', "Start page was not fetched (blocked by robots.txt)"
+        elif not landing_status:
+            outcome, description = 'error', "Start page could not be fetched"
+        elif not 200 <= landing_status < 300:
+            outcome, description = 'error', f"Start page returned status {landing_status}"
+        else:
+            outcome, description = 'clean', None
+        
+        verdict = {
+            'url': start_url,
+            'verdict': outcome,
+            'evidence_url': finding.url if finding else None,
+            'description': description,
+            'time_to_verdict': round(time_to_verdict, 3),
+            'requests': self.counters.fetches,
+        }
+        logger.info(f"Verdict for {start_url}: {verdict['verdict']} after {verdict['requests']} requests "
+                    f"in {verdict['time_to_verdict']:.2f}s")
+        return verdict
+
+    def replay_archive(self, archive_path: str, batch_size: int = 64) -> ResultStore:
+        """Rescan every response recorded in a WARC archive, in parallel worker processes"""
+        logger.info(f"Replaying archived responses from {archive_path}")
+        
+        reader = WarcReader(archive_path)
+        try:
+            # Keep the most recent capture of each URL
+            latest = {}
+            for entry in reader.index:
+                if self.is_scannable_type(entry['content_type']):
+                    latest[entry['url']] = entry
+        finally:
+            reader.close()
+        
+        entries = list(latest.values())
+        batches = [entries[i:i + batch_size] for i in range(0, len(entries), batch_size)]
+        self.counters = ReportCounters()
+        results = []
+        
+        with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker,
+                                 initargs=(self.threat_patterns, self.malicious_domains,
+                                           worker_logging_config())) as executor:
+            futures = [executor.submit(_replay_batch, archive_path, batch) for batch in batches]
+            for future in as_completed(futures):
+                batch_results, script_graph, urls = future.result()
+                self.counters.record(batch_results)
+                results.extend(batch_results)
+                self.visited_urls.update(urls)
+                for source, targets in script_graph.items():
+                    self.script_graph.setdefault(source, set()).update(targets)
+        
+        self.scan_results = ResultStore(results)
+        logger.info(f"Replay completed. Rescanned {len(entries)} responses, found {len(results)} polyfill.io references.")
+        return self.scan_results
+
+    @staticmethod
+    def iter_local_files(root: str, extensions: Iterable[str]) -> Iterator[str]:
+        """Walk a directory tree with os.scandir, yielding files with matching extensions"""
+        extensions = tuple(ext.lower() for ext in extensions)
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name not in LOCAL_SKIP_DIRS:
+                                    stack.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False) and entry.name.lower().endswith(extensions):
+                                yield entry.path
+                        except OSError:
+                            continue
+            except OSError as e:
+                logger.warning(f"Cannot read directory {directory}: {e}")
+
+    def scan_directory(self, root: str, extensions: Iterable[str] = LOCAL_EXTENSIONS, batch_size: int = 256,
+                       mmap_threshold: int = 1024 * 1024) -> ResultStore:
+        """Scan a local tree (webroot, build output, node_modules) with the same signatures, across processes"""
+        if not os.path.isdir(root):
+            raise ValueError(f"Not a directory: {root}")
+        logger.info(f"Starting polyfill.io scan of local directory {root}")
+        
+        self.counters = ReportCounters()
+        results = []
+        files_scanned = 0
+        
+        with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker,
+                                 initargs=(self.threat_patterns, self.malicious_domains,
+                                           worker_logging_config())) as executor:
+            futures = []
+            batch = []
+            for path in self.iter_local_files(root, extensions):
+                batch.append(path)
+                if len(batch) >= batch_size:
+                    futures.append(executor.submit(_scan_file_batch, batch, mmap_threshold))
+                    batch = []
+            if batch:
+                futures.append(executor.submit(_scan_file_batch, batch, mmap_threshold))
+            
+            for future in as_completed(futures):
+                batch_results, scanned = future.result()
+                files_scanned += scanned
+                self.counters.record(batch_results)
+                results.extend(batch_results)
+        
+        self.files_scanned = files_scanned
+        self.scan_results = ResultStore(results)
+        logger.info(f"Local scan completed. Scanned {files_scanned} files, found {len(results)} polyfill.io references.")
+        return self.scan_results
+
+    def write_report(self, fh: TextIO, rollups: bool = False):
+        """Stream the scan report to an open text file handle, one line at a time"""
         if not self.scan_results:
-            return "No polyfill.io references detected."
+            fh.write("No polyfill.io references detected.\n")
+            self.metrics.write(fh)
+            if self.sample_estimates is not None:
+                self.sample_estimates.write(fh)
+            return
         
-        # Group results by severity
-        by_severity = {}
-        for result in self.scan_results:
-            severity = result.severity
-            if severity not in by_severity:
-                by_severity[severity] = []
-            by_severity[severity].append(result)
-        
-        report = []
-        report.append("=" * 80)
-        report.append("POLYFILL.IO SCAN REPORT")
-        report.append("=" * 80)
-        report.append(f"Scan Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append(f"Total URLs Scanned: {len(self.visited_urls)}")
-        report.append(f"Total Polyfill.io References Found: {len(self.scan_results)}")
-        report.append("")
+        # Use the counters kept during the crawl unless results were loaded some other way
+        counters = self.counters
+        if counters.total != len(self.scan_results):
+            counters = ReportCounters(self.scan_results)
+        
+        fh.write("=" * 80 + "\n")
+        fh.write("POLYFILL.IO SCAN REPORT\n")
+        fh.write("=" * 80 + "\n")
+        fh.write(f"Scan Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        if self.files_scanned is not None:
+            fh.write(f"Total Files Scanned: {self.files_scanned}\n")
+        else:
+            fh.write(f"Total URLs Scanned: {len(self.visited_urls)}\n")
+        fh.write(f"Total Polyfill.io References Found: {counters.total}\n")
+        fh.write("\n")
         
         # Summary by severity
-        report.append("POLYFILL.IO REFERENCES BY SEVERITY:")
-        report.append("-" * 40)
-        for severity in ['HIGH', 'MEDIUM', 'LOW']:
-            if severity in by_severity:
-                count = len(by_severity[severity])
-                report.append(f"{severity}: {count} references")
-        report.append("")
-        
-        # Detailed results
-        for severity in ['HIGH', 'MEDIUM', 'LOW']:
-            if severity in by_severity:
-                report.append(f"{severity} SEVERITY POLYFILL.IO REFERENCES:")
-                report.append("-" * 40)
-                
-                for result in by_severity[severity]:
-                    report.append(f"URL: {result.url}")
-                    report.append(f"Type: {result.threat_type}")
-                    report.append(f"Description: {result.description}")
-                    report.append(f"Details: {result.details}")
-                    report.append(f"Timestamp: {result.timestamp}")
-                    report.append("")
+        fh.write("POLYFILL.IO REFERENCES BY SEVERITY:\n")
+        fh.write("-" * 40 + "\n")
+        for severity in SEVERITIES:
+            if severity in counters.by_severity:
+                fh.write(f"{severity}: {counters.by_severity[severity]} references\n")
+        fh.write("\n")
         
-        report_text = "\n".join(report)
+        self.metrics.write(fh)
+        if self.sample_estimates is not None:
+            self.sample_estimates.write(fh)
+        
+        # Rollups keep huge reports readable
+        if rollups:
+            fh.write("POLYFILL.IO REFERENCES BY DOMAIN:\n")
+            fh.write("-" * 40 + "\n")
+            for domain, count in counters.by_domain.most_common():
+                fh.write(f"{domain}: {count} references\n")
+            fh.write("\n")
+            
+            fh.write("POLYFILL.IO REFERENCES BY URL:\n")
+            fh.write("-" * 40 + "\n")
+            for url, count in counters.by_url.most_common():
+                fh.write(f"{url}: {count} references\n")
+            fh.write("\n")
+        
+        # Detailed results, written straight through without buffering
+        for severity in SEVERITIES:
+            if severity in counters.by_severity:
+                fh.write(f"{severity} SEVERITY POLYFILL.IO REFERENCES:\n")
+                fh.write("-" * 40 + "\n")
+                
+                for result in self.scan_results.iter_severity(severity):
+                    fh.write(f"URL: {result.url}\n")
+                    fh.write(f"Type: {result.threat_type}\n")
+                    fh.write(f"Description: {result.description}\n")
+                    fh.write(f"Details: {result.details}\n")
+                    fh.write(f"Timestamp: {result.timestamp}\n")
+                    fh.write("\n")
+
+    def save_report(self, output_file: str, rollups: bool = False):
+        """Stream the scan report to a file"""
+        with open(output_file, 'w', encoding='utf-8') as f:
+            self.write_report(f, rollups)
+        logger.info(f"Report saved to {output_file}")
+
+    def generate_report(self, output_file: str = None, rollups: bool = False) -> str:
+        """Generate a detailed scan report"""
+        buffer = io.StringIO()
+        self.write_report(buffer, rollups)
+        report_text = buffer.getvalue()[:-1]
         
         if output_file:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(report_text)
-            logger.info(f"Report saved to {output_file}")
+            self.save_report(output_file, rollups)
         
         return report_text
 
@@ -334,37 +1489,227 @@ class PolyfillScanner:
         
         logger.info(f"JSON results exported to {output_file}")
 
+    def export_parquet(self, output_file: str):
+        """Export scan results to Parquet format (requires pyarrow)"""
+        self.scan_results.export_parquet(output_file)
+        logger.info(f"Parquet results exported to {output_file}")
+
+    def export_script_graph(self, output_file: str):
+        """Export the discovered script dependency graph to JSON format"""
+        graph_data = {source: sorted(targets) for source, targets in sorted(self.script_graph.items())}
+        
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(graph_data, f, indent=2, ensure_ascii=False)
+        
+        logger.info(f"Script dependency graph exported to {output_file}")
+
+# Per-process scanner used by the replay and local-scan worker pools
+_worker_scanner = None
+
+
+def _init_worker(threat_patterns: dict, malicious_domains: Set[str], log_config: tuple = None):
+    """Worker-process initializer: build one scanner with the parent's signatures"""
+    global _worker_scanner
+    configure_worker_logging(log_config)
+    _worker_scanner = PolyfillScanner(delay=0)
+    _worker_scanner.threat_patterns = threat_patterns
+    _worker_scanner.malicious_domains = malicious_domains
+
+
+def _replay_batch(archive_path: str, entries: List[dict]) -> Tuple[List[ScanResult], Dict[str, Set[str]], List[str]]:
+    """Worker-process entry point: scan a batch of archived responses"""
+    scanner = _worker_scanner
+    scanner.script_graph = {}
+    reader = WarcReader(archive_path)
+    results = []
+    urls = []
+    try:
+        for entry in entries:
+            url, status, content_type, body = reader.read(entry)
+            urls.append(url)
+            results.extend(scanner.scan_bytes(body, url))
+            
+            # Rebuild the script dependency graph from the archived pages
+            content = scanner.decode_content(body, content_type)
+            if 'text/html' in content_type:
+                scanner.extract_links(content, url)
+            else:
+                scanner.extract_script_dependencies(content, url)
+    finally:
+        reader.close()
+    return results, scanner.script_graph, urls
+
+
+def _scan_file_batch(paths: List[str], mmap_threshold: int) -> Tuple[List[ScanResult], int]:
+    """Worker-process entry point: scan a batch of local files, memory-mapping the large ones"""
+    scanner = _worker_scanner
+    results = []
+    scanned = 0
+    for path in paths:
+        try:
+            with open(path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    continue
+                if size >= mmap_threshold:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        results.extend(scanner.scan_bytes(mapped, path))
+                else:
+                    results.extend(scanner.scan_bytes(f.read(), path))
+            scanned += 1
+        except (OSError, ValueError):
+            continue
+    return results, scanned
+
+
 def main():
     """Main function with command-line interface"""
     parser = argparse.ArgumentParser(description='Polyfill.io Scanner')
-    parser.add_argument('url', help='URL to scan')
+    parser.add_argument('url', nargs='?', help='URL to scan (not needed with --replay or --path)')
     parser.add_argument('--depth', type=int, default=2, help='Maximum crawl depth (default: 2)')
     parser.add_argument('--workers', type=int, default=5, help='Number of worker threads (default: 5)')
+    parser.add_argument('--verdict', action='store_true',
+                        help='Only decide whether each target references polyfill.io, stopping at the first HIGH finding')
+    parser.add_argument('--targets', help='File of target URLs, one per line, for --verdict sweeps')
+    parser.add_argument('--sample', type=int, metavar='N',
+                        help='Sampling crawl: fetch N pages per path template and estimate prevalence')
+    parser.add_argument('--sample-max-pages', type=int, default=1000,
+                        help='Maximum pages fetched by a sampling crawl (default: 1000)')
+    parser.add_argument('--shards', type=int, default=1, help='Crawl in this many processes, partitioned by host (default: 1)')
     parser.add_argument('--delay', type=float, default=1.0, help='Delay between requests in seconds (default: 1.0)')
+    parser.add_argument('--max-body-mb', type=float, default=DEFAULT_MAX_BODY_BYTES / (1024 * 1024),
+                        help='Maximum decoded size of a response body in MB (default: 50)')
+    parser.add_argument('--memory-budget-mb', type=float,
+                        help='Keep the crawl within this much memory: hold back downloads and spill the frontier to disk')
+    parser.add_argument('--spill-dir', help='Directory for frontier spill files with --memory-budget-mb (default: system temp)')
+    parser.add_argument('--sitemaps', action='store_true', help='Seed the crawl from robots.txt Sitemap: lines and /sitemap.xml')
+    parser.add_argument('--sitemap-limit', type=int, default=500, help='Maximum URLs to seed from sitemaps (default: 500)')
     parser.add_argument('--bypass-robots', action='store_true', help='Bypass robots.txt restrictions (use with caution)')
     parser.add_argument('--output', help='Output file for report')
+    parser.add_argument('--rollup', action='store_true', help='Add per-domain and per-URL rollups to the report')
     parser.add_argument('--json', help='Export results to JSON file')
+    parser.add_argument('--redirect-cache', help='JSON file of permanent redirects reused and updated across runs')
+    parser.add_argument('--db', help='Record the run and its findings in a SQLite findings database')
+    parser.add_argument('--record', help='Record fetched responses to a compressed WARC archive for offline rescans')
+    parser.add_argument('--path', help='Scan a local directory tree (webroot, build output, node_modules) instead of crawling')
+    parser.add_argument('--extensions', default=','.join(LOCAL_EXTENSIONS),
+                        help='Comma-separated file extensions scanned with --path (default: common web/JS types)')
+    parser.add_argument('--replay', help='Rescan the responses in a recorded WARC archive instead of crawling')
+    parser.add_argument('--parquet', help='Export results to Parquet file (requires pyarrow)')
+    parser.add_argument('--script-graph', help='Export script dependency graph to JSON file')
+    parser.add_argument('--profile', metavar='PREFIX', help='Profile the scan, writing PREFIX.pstats/.txt/.folded')
+    parser.add_argument('--profile-mode', choices=PROFILE_MODES, default='cprofile',
+                        help='cprofile (deterministic, all threads) or sample (wall-clock stack sampling) (default: cprofile)')
+    parser.add_argument('--profile-interval', type=float, default=0.005,
+                        help='Seconds between stack samples in sample mode (default: 0.005)')
+    parser.add_argument('--log-file', default=DEFAULT_LOG_FILE, help=f"Log file, empty to disable (default: {DEFAULT_LOG_FILE})")
+    parser.add_argument('--log-json', action='store_true', help='Write log lines as JSON objects')
+    parser.add_argument('--log-sample', type=float, default=1.0,
+                        help='Fraction of URLs whose per-URL INFO/DEBUG lines are logged (default: 1.0)')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
     
     args = parser.parse_args()
     
-    if args.verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
+    if not args.url and not args.replay and not args.path and not (args.verdict and args.targets):
+        parser.error('a URL to scan is required unless --replay, --path or --verdict --targets is given')
+    if args.targets and not args.verdict:
+        parser.error('--targets requires --verdict')
+    if args.shards > 1 and args.record:
+        parser.error('--record cannot be combined with --shards')
+    if args.sample and args.shards > 1:
+        parser.error('--sample cannot be combined with --shards')
+    
+    configure_logging(args.log_file or None, logging.DEBUG if args.verbose else logging.INFO,
+                      json_format=args.log_json, url_sample_rate=args.log_sample)
     
+    findings_db = None
+    recorder = None
     try:
-        scanner = PolyfillScanner(max_workers=args.workers, delay=args.delay, bypass_robots=args.bypass_robots)
+        findings_db = FindingsDatabase(args.db) if args.db else None
+        recorder = WarcWriter(args.record) if args.record else None
+        memory_budget = None
+        if args.memory_budget_mb:
+            memory_budget = MemoryBudget(int(args.memory_budget_mb * MB), spill_dir=args.spill_dir)
+        scanner = PolyfillScanner(max_workers=args.workers, delay=args.delay, bypass_robots=args.bypass_robots,
+                                  findings_db=findings_db, recorder=recorder,
+                                  max_body_bytes=int(args.max_body_mb * 1024 * 1024), memory_budget=memory_budget)
         if args.bypass_robots:
             logger.warning("WARNING: Bypassing robots.txt restrictions. Use responsibly!")
-        results = scanner.scan_website(args.url, max_depth=args.depth)
+        if args.redirect_cache:
+            scanner.load_redirect_cache(args.redirect_cache)
+        profiler = ScanProfiler(args.profile, args.profile_mode, args.profile_interval) if args.profile else nullcontext()
         
-        # Generate and display report
-        report = scanner.generate_report(args.output)
-        print(report)
+        if args.verdict:
+            targets = [args.url] if args.url else []
+            if args.targets:
+                with open(args.targets, 'r', encoding='utf-8') as f:
+                    targets.extend(line.strip() for line in f if line.strip() and not line.startswith('#'))
+            verdicts = []
+            with profiler:
+                for target in targets:
+                    # One bad target must not abort the rest of the sweep
+                    try:
+                        verdicts.append(scanner.copy_engine().verdict_scan(target, max_depth=args.depth))
+                    except Exception as e:
+                        logger.error(f"Verdict sweep of {target} failed: {e}", extra={'url': target})
+                        verdicts.append({'url': target, 'verdict': 'error', 'evidence_url': None,
+                                         'description': str(e), 'time_to_verdict': 0.0, 'requests': 0})
+            
+            for verdict in verdicts:
+                detail = verdict['description'] if verdict['verdict'] == 'error' else verdict['evidence_url']
+                evidence = f" ({detail})" if detail else ""
+                print(f"{verdict['verdict'].upper():5} {verdict['url']}{evidence} - "
+                      f"{verdict['time_to_verdict']:.2f}s, {verdict['requests']} requests")
+            if args.json:
+                with open(args.json, 'w', encoding='utf-8') as f:
+                    json.dump(verdicts, f, indent=2)
+            dirty = sum(1 for verdict in verdicts if verdict['verdict'] == 'dirty')
+            errors = sum(1 for verdict in verdicts if verdict['verdict'] == 'error')
+            logger.info(f"{dirty} of {len(verdicts)} targets reference polyfill.io"
+                        f"{f', {errors} could not be checked' if errors else ''}")
+            exit(1 if dirty else 2 if errors else 0)
+        
+        with profiler:
+            if args.path:
+                extensions = [ext if ext.startswith('.') else f'.{ext}'
+                              for ext in (ext.strip() for ext in args.extensions.split(',')) if ext]
+                results = scanner.scan_directory(args.path, extensions)
+            elif args.replay:
+                results = scanner.replay_archive(args.replay)
+            elif args.sample:
+                from sample_crawl import SamplingCrawler
+                results = SamplingCrawler(scanner, args.sample, args.sample_max_pages).scan_website(
+                    args.url, max_depth=args.depth, use_sitemaps=args.sitemaps, sitemap_limit=args.sitemap_limit
+                )
+            elif args.shards > 1:
+                from shard_crawl import ShardedCrawler
+                results = ShardedCrawler(scanner, args.shards).scan_website(
+                    args.url, max_depth=args.depth, use_sitemaps=args.sitemaps, sitemap_limit=args.sitemap_limit
+                )
+            else:
+                results = scanner.scan_website(args.url, max_depth=args.depth, use_sitemaps=args.sitemaps,
+                                               sitemap_limit=args.sitemap_limit)
+        
+        if args.redirect_cache and not (args.path or args.replay):
+            scanner.save_redirect_cache(args.redirect_cache)
+        
+        # Stream the report to the console and, if requested, to a file
+        scanner.write_report(sys.stdout, rollups=args.rollup)
+        if args.output:
+            scanner.save_report(args.output, rollups=args.rollup)
         
         # Export to JSON if requested
         if args.json:
             scanner.export_json(args.json)
         
+        # Export to Parquet if requested
+        if args.parquet:
+            scanner.export_parquet(args.parquet)
+        
+        # Export script dependency graph if requested
+        if args.script_graph:
+            scanner.export_script_graph(args.script_graph)
+        
         # Exit with error code if polyfill.io references found
         polyfill_count = len([r for r in results if r.threat_type == 'polyfill.io'])
         if polyfill_count > 0:
@@ -380,6 +1725,11 @@ def main():
     except Exception as e:
         logger.error(f"Scan failed: {e}")
         exit(1)
+    finally:
+        if findings_db:
+            findings_db.close()
+        if recorder:
+            recorder.close()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Memory Budget
+Keep a crawl within a memory budget instead of letting it grow until the host
+OOM-kills it.
+
+MemoryBudget tracks the process RSS and the response bytes held by downloads in
+flight: new downloads wait while held bytes exceed their share of the budget, and
+the crawl stops dispatching work while RSS is over budget. SpillFrontier is a FIFO
+crawl frontier that keeps a bounded number of entries in memory and appends the
+rest to a temporary file, preserving breadth-first order. SeenUrls remembers which
+URLs were already queued as 64-bit digests and moves them to an on-disk SQLite
+table once there are too many to keep in memory.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+from collections import deque
+from typing import Optional, Tuple
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+
+def current_rss() -> Optional[int]:
+    """Resident set size of this process in bytes, or None if it cannot be read"""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class MemoryBudget:
+    """Process memory limit with backpressure on in-flight response bodies"""
+
+    def __init__(self, limit_bytes: int, body_fraction: float = 0.25, spill_fraction: float = 0.75,
+                 frontier_items: int = 10000, spill_dir: Optional[str] = None):
+        self.limit_bytes = limit_bytes
+        self.body_limit = int(limit_bytes * body_fraction)
+        self.spill_bytes = int(limit_bytes * spill_fraction)
+        self.frontier_items = frontier_items
+        self.spill_dir = spill_dir
+        self._condition = threading.Condition()
+        self.body_bytes = 0
+        self.body_waits = 0
+
+    def admit_body(self):
+        """Block a new download while bodies in flight already use their share of the budget.
+
+        Downloads already running never wait, so the budget cannot deadlock; it only
+        limits how many large bodies are held at once.
+        """
+        with self._condition:
+            if self.body_bytes >= self.body_limit:
+                self.body_waits += 1
+                while self.body_bytes >= self.body_limit:
+                    self._condition.wait()
+
+    def add_body(self, size: int):
+        with self._condition:
+            self.body_bytes += size
+
+    def release_body(self, size: int):
+        with self._condition:
+            self.body_bytes -= size
+            self._condition.notify_all()
+
+    def frontier(self) -> 'SpillFrontier':
+        return SpillFrontier(self.frontier_items, self.spill_dir)
+
+    def seen_urls(self) -> 'SeenUrls':
+        return SeenUrls(self.frontier_items, self.spill_dir)
+
+    def over_budget(self, rss: Optional[int]) -> bool:
+        return rss is not None and rss > self.limit_bytes
+
+    def should_spill(self, rss: Optional[int]) -> bool:
+        return rss is not None and rss > self.spill_bytes
+
+
+class SpillFrontier:
+    """FIFO of (url, depth) that keeps at most max_in_memory entries in memory and spills the rest to disk"""
+
+    def __init__(self, max_in_memory: int = 10000, spill_dir: Optional[str] = None):
+        self.max_in_memory = max_in_memory
+        self.spill_dir = spill_dir
+        self._memory: deque = deque()
+        self._file = None
+        self._read_position = 0
+        self._on_disk = 0
+        self.spilled_total = 0
+        self.force_spill = False
+
+    def push(self, url: str, depth: int):
+        # Once anything is on disk, new entries go behind it to keep FIFO order
+        if self._on_disk or self.force_spill or len(self._memory) >= self.max_in_memory:
+            if self._file is None:
+                self._file = tempfile.TemporaryFile('w+', encoding='utf-8', dir=self.spill_dir)
+                logger.info("Crawl frontier is spilling to disk")
+            self._file.seek(0, os.SEEK_END)
+            self._file.write(json.dumps([url, depth]) + '\n')
+            self._on_disk += 1
+            self.spilled_total += 1
+        else:
+            self._memory.append((url, depth))
+
+    def pop(self) -> Tuple[str, int]:
+        if not self._memory and self._on_disk:
+            self._refill()
+        return self._memory.popleft()
+
+    def _refill(self):
+        self._file.seek(self._read_position)
+        while self._on_disk and len(self._memory) < self.max_in_memory:
+            url, depth = json.loads(self._file.readline())
+            self._memory.append((url, depth))
+            self._on_disk -= 1
+        self._read_position = self._file.tell()
+        if not self._on_disk:
+            # Everything was read back; start the spill file over
+            self._file.seek(0)
+            self._file.truncate()
+            self._read_position = 0
+
+    def __len__(self) -> int:
+        return len(self._memory) + self._on_disk
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class SeenUrls:
+    """Set of queued URLs kept as 64-bit digests, moved to an on-disk SQLite table past max_in_memory entries"""
+
+    def __init__(self, max_in_memory: Optional[int] = None, spill_dir: Optional[str] = None):
+        self.max_in_memory = max_in_memory
+        self.spill_dir = spill_dir
+        self._memory = set()
+        self._db = None
+        self._path = None
+        self._on_disk = 0
+        self.force_spill = False
+
+    @staticmethod
+    def _digest(url: str) -> int:
+        return int.from_bytes(hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest(), 'big', signed=True)
+
+    def add(self, url: str) -> bool:
+        """Remember url; return False if it was already seen"""
+        key = self._digest(url)
+        if self._db is None and (self.force_spill or (self.max_in_memory is not None
+                                                       and len(self._memory) >= self.max_in_memory)):
+            self._spill()
+        if self._db is not None:
+            added = self._db.execute('INSERT OR IGNORE INTO seen (digest) VALUES (?)', (key,)).rowcount == 1
+            self._on_disk += added
+            return added
+        if key in self._memory:
+            return False
+        self._memory.add(key)
+        return True
+
+    def _spill(self):
+        fd, self._path = tempfile.mkstemp(suffix='.sqlite', dir=self.spill_dir)
+        os.close(fd)
+        # Autocommit without a journal: the table is scratch space that dies with the crawl
+        self._db = sqlite3.connect(self._path, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=OFF')
+        self._db.execute('PRAGMA synchronous=OFF')
+        self._db.execute('CREATE TABLE seen (digest INTEGER PRIMARY KEY)')
+        self._db.execute('BEGIN')
+        self._db.executemany('INSERT INTO seen (digest) VALUES (?)', ((key,) for key in self._memory))
+        self._db.execute('COMMIT')
+        self._on_disk = len(self._memory)
+        self._memory = set()
+        logger.info("Queued URL set is spilling to disk")
+
+    def __len__(self) -> int:
+        return len(self._memory) + self._on_disk
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+            os.unlink(self._path)
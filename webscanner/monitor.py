@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Polyfill.io Monitor
+Continuously watches sites for reintroduced (or removed) polyfill.io references.
+
+Instead of re-crawling every target from scratch, the monitor remembers each
+page's content hash and validators (ETag / Last-Modified), rechecks pages with
+conditional requests on an adaptive schedule (pages that change are checked more
+often, pages that never change back off), and only emits diff events:
+
+    {"event": "new", "url": ..., "threat_type": ..., ...}
+    {"event": "resolved", "url": ..., "threat_type": ..., ...}
+
+A full discovery crawl still runs periodically to pick up new pages.
+
+Usage:
+    python monitor.py https://example.com https://example.org --state monitor_state.json
+    python monitor.py https://example.com --once --events events.jsonl
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import requests
+
+from malware_scanner import PolyfillScanner, ScanResult, logger
+from scan_logging import configure_logging
+
+FindingKey = Tuple[str, str, str]  # (threat_type, description, severity)
+
+
+def finding_keys(results: Iterable[ScanResult]) -> Set[FindingKey]:
+    """Position-independent identity of a page's findings, so unrelated edits do not produce events"""
+    return {(result.threat_type, result.description, result.severity) for result in results}
+
+
+class Monitor:
+    """Change-aware incremental recrawler that emits new/resolved finding events"""
+
+    def __init__(self, scanner: PolyfillScanner, state_file: str, depth: int = 2,
+                 min_interval: float = 3600, max_interval: float = 7 * 86400,
+                 discover_interval: float = 86400, events_file: Optional[str] = None):
+        self.scanner = scanner
+        self.state_file = state_file
+        self.depth = depth
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.discover_interval = discover_interval
+        self.events_file = events_file
+        self._lock = threading.Lock()
+        self.state = self._load_state()
+        self.requests_made = 0
+        self.not_modified = 0
+
+    # State
+
+    def _load_state(self) -> dict:
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            state = {}
+        state.setdefault('targets', {})
+        state.setdefault('urls', {})
+        return state
+
+    def save_state(self):
+        """Write the state file atomically"""
+        temp_file = self.state_file + '.tmp'
+        with self._lock:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(self.state, f)
+        os.replace(temp_file, self.state_file)
+
+    def _page(self, url: str, target: str) -> dict:
+        return self.state['urls'].setdefault(url, {
+            'target': target,
+            'hash': None,
+            'etag': None,
+            'last_modified': None,
+            'interval': self.min_interval,
+            'next_due': 0,
+            'last_checked': None,
+            'last_changed': None,
+            'ignored': False,
+            'findings': [],
+        })
+
+    # Events
+
+    def _emit(self, event: str, url: str, key: FindingKey):
+        threat_type, description, severity = key
+        record = {
+            'event': event,
+            'url': url,
+            'threat_type': threat_type,
+            'description': description,
+            'severity': severity,
+            'time': time.time(),
+        }
+        line = json.dumps(record, ensure_ascii=False)
+        print(line, flush=True)
+        if self.events_file:
+            with self._lock:
+                with open(self.events_file, 'a', encoding='utf-8') as f:
+                    f.write(line + '\n')
+        if event == 'new':
+            logger.warning(f"New finding on {url}: {description}")
+        else:
+            logger.info(f"Resolved finding on {url}: {description}")
+
+    def _update_findings(self, url: str, page: dict, current: Set[FindingKey]):
+        previous = {tuple(key) for key in page['findings']}
+        for key in sorted(current - previous):
+            self._emit('new', url, key)
+        for key in sorted(previous - current):
+            self._emit('resolved', url, key)
+        page['findings'] = sorted(list(key) for key in current)
+
+    # Discovery
+
+    def discover(self, target: str):
+        """Full crawl of a target to find its pages; findings are diffed like any recheck"""
+        logger.info(f"Discovery crawl of {target}")
+        scanner = self.scanner.copy_engine()
+        # Only pages fetched as 2xx HTML/JavaScript are monitored, not redirect hops or failed fetches
+        fetched: Set[str] = set()
+
+        def on_page(url: str, status_code: int, content_type: str):
+            if 200 <= status_code < 300 and scanner.is_scannable_type(content_type):
+                fetched.add(url)
+
+        scanner.on_page = on_page
+        results = scanner.scan_website(target, max_depth=self.depth)
+        self.requests_made += len(scanner.visited_urls)
+
+        by_url: Dict[str, List[ScanResult]] = {}
+        for result in results:
+            by_url.setdefault(result.url, []).append(result)
+
+        now = time.time()
+        with self._lock:
+            self.state['targets'].setdefault(target, {})['last_discovery'] = now
+            pages = {url: self._page(url, target) for url in fetched}
+        for url, page in pages.items():
+            if page['ignored']:
+                continue
+            if page['last_checked'] is None:
+                # Just fetched by the crawl; schedule the first recheck normally
+                page['last_checked'] = now
+                page['next_due'] = now + page['interval']
+            self._update_findings(url, page, finding_keys(by_url.get(url, [])))
+
+    # Rechecks
+
+    def check(self, url: str, page: dict):
+        """Conditionally refetch one page and rescan it only if it changed"""
+        headers = {}
+        if page['etag']:
+            headers['If-None-Match'] = page['etag']
+        if page['last_modified']:
+            headers['If-Modified-Since'] = page['last_modified']
+
+        time.sleep(self.scanner.delay)
+        now = time.time()
+        changed = False
+        try:
+            with self.scanner.session.get(url, headers=headers, timeout=10, stream=True) as response:
+                self.requests_made += 1
+                content_type = response.headers.get('content-type', '').lower()
+                if response.status_code == 304:
+                    self.not_modified += 1
+                elif not 200 <= response.status_code < 300:
+                    # Error pages and outages are not content; keep the last good state and back off
+                    logger.warning(f"Recheck of {url} returned status {response.status_code}", extra={'url': url})
+                elif not self.scanner.is_scannable_type(content_type):
+                    page['ignored'] = True
+                else:
+                    hasher = hashlib.blake2b(digest_size=16)
+
+                    def hashed(chunks):
+                        for chunk in chunks:
+                            hasher.update(chunk)
+                            yield chunk
+
+                    results = self.scanner.scan_chunks(hashed(self.scanner.iter_body(url, response)), url)
+                    content_hash = hasher.hexdigest()
+                    if content_hash != page['hash']:
+                        # The first hash of a page found by discovery is not a change
+                        changed = page['hash'] is not None
+                        self._update_findings(url, page, finding_keys(results))
+                    page['hash'] = content_hash
+                    page['etag'] = response.headers.get('etag')
+                    page['last_modified'] = response.headers.get('last-modified')
+        except requests.RequestException as e:
+            logger.warning(f"Failed to recheck {url}: {e}", extra={'url': url})
+        except Exception as e:
+            # One broken page must not stop the pass; it is retried after the usual back-off
+            logger.error(f"Error rechecking {url}: {e}", extra={'url': url})
+
+        # Pages that change are checked more often, stable pages back off
+        if changed:
+            page['last_changed'] = now
+            page['interval'] = max(self.min_interval, page['interval'] / 2)
+        else:
+            page['interval'] = min(self.max_interval, page['interval'] * 2)
+        page['last_checked'] = now
+        page['next_due'] = now + page['interval']
+
+    def due_pages(self, now: float) -> List[Tuple[str, dict]]:
+        """Pages due for a recheck, most recently changed first"""
+        with self._lock:
+            due = [(url, page) for url, page in self.state['urls'].items()
+                   if not page['ignored'] and page['next_due'] <= now]
+        due.sort(key=lambda item: -(item[1]['last_changed'] or 0))
+        return due
+
+    def run_once(self, targets: List[str]):
+        """Run discovery where due, then recheck every due page"""
+        now = time.time()
+        try:
+            for target in targets:
+                last_discovery = self.state['targets'].get(target, {}).get('last_discovery', 0)
+                if now - last_discovery >= self.discover_interval:
+                    self.discover(target)
+
+            due = self.due_pages(time.time())
+            if due:
+                logger.info(f"Rechecking {len(due)} pages")
+                with ThreadPoolExecutor(max_workers=self.scanner.max_workers) as executor:
+                    list(executor.map(lambda item: self.check(*item), due))
+        finally:
+            self.save_state()
+
+    def next_wakeup(self, targets: List[str]) -> float:
+        """Seconds until the next page or discovery crawl is due"""
+        now = time.time()
+        times = [page['next_due'] for page in self.state['urls'].values() if not page['ignored']]
+        times.extend(self.state['targets'].get(target, {}).get('last_discovery', 0) + self.discover_interval
+                     for target in targets)
+        return max(1.0, min(times, default=now + self.min_interval) - now)
+
+    def run_forever(self, targets: List[str], max_sleep: float = 300):
+        while True:
+            self.run_once(targets)
+            logger.info(f"Requests so far: {self.requests_made} ({self.not_modified} not modified)")
+            time.sleep(min(max_sleep, self.next_wakeup(targets)))
+
+
+def main():
+    """Main function with command-line interface"""
+    parser = argparse.ArgumentParser(description='Continuously monitor sites for polyfill.io references')
+    parser.add_argument('targets', nargs='+', help='Start URLs to monitor')
+    parser.add_argument('--state', default='monitor_state.json', help='State file (default: monitor_state.json)')
+    parser.add_argument('--events', help='Also append diff events to this JSON-lines file')
+    parser.add_argument('--depth', type=int, default=2, help='Discovery crawl depth (default: 2)')
+    parser.add_argument('--min-interval', type=float, default=3600, help='Fastest recheck interval in seconds (default: 3600)')
+    parser.add_argument('--max-interval', type=float, default=7 * 86400, help='Slowest recheck interval in seconds (default: 7 days)')
+    parser.add_argument('--discover-interval', type=float, default=86400, help='Seconds between discovery crawls (default: 86400)')
+    parser.add_argument('--workers', type=int, default=5, help='Number of worker threads (default: 5)')
+    parser.add_argument('--delay', type=float, default=1.0, help='Delay between requests in seconds (default: 1.0)')
+    parser.add_argument('--bypass-robots', action='store_true', help='Bypass robots.txt restrictions (use with caution)')
+    parser.add_argument('--once', action='store_true', help='Run a single pass and exit (for cron)')
+    args = parser.parse_args()
+    configure_logging()
+
+    scanner = PolyfillScanner(max_workers=args.workers, delay=args.delay, bypass_robots=args.bypass_robots)
+    for target in args.targets:
+        if not scanner.is_valid_url(target):
+            parser.error(f"Invalid URL: {target}")
+
+    monitor = Monitor(scanner, args.state, depth=args.depth, min_interval=args.min_interval,
+                      max_interval=args.max_interval, discover_interval=args.discover_interval,
+                      events_file=args.events)
+    try:
+        if args.once:
+            monitor.run_once(args.targets)
+        else:
+            monitor.run_forever(args.targets)
+    except KeyboardInterrupt:
+        logger.info("Monitor stopped")
+        monitor.save_state()
+        sys.exit(130)
+
+
+if __name__ == "__main__":
+    main()
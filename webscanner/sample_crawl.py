@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Sampling Crawl
+Estimate how widespread polyfill.io is on very large sites without crawling every page.
+
+Discovered URLs are grouped by path template (for example /products/{id} or
+/blog/{slug}), and only a fixed number of pages per template is fetched. Every
+discovered URL still counts towards its template's population, so the report can
+give an estimated prevalence with a confidence interval per template and for the
+whole site. Templated pages usually share their script tags, so a site-wide
+injection shows up in the first few samples of every template.
+
+Usage:
+    python malware_scanner.py https://example.com --sample 5 --sample-max-pages 500 --sitemaps --depth 4
+"""
+
+import heapq
+import itertools
+import math
+import re
+import threading
+import time
+import urllib.parse
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from statistics import NormalDist
+from typing import Dict, List, Set, TextIO, Tuple
+
+from malware_scanner import PolyfillScanner, ReportCounters, ResultStore, ScanResult, logger
+from url_model import host_of, parse_url
+
+# Path segments that identify one item of a template
+_ID_SEGMENT = re.compile(r'\d+|[0-9a-f]{8,}|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', re.IGNORECASE)
+_DIGITS = re.compile(r'\d+')
+
+# Static assets never carry script references; they are neither fetched nor counted as pages
+ASSET_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.ico', '.css', '.woff', '.woff2',
+                    '.ttf', '.eot', '.pdf', '.zip', '.mp3', '.mp4', '.webm')
+
+
+def path_template(url: str) -> str:
+    """Collapse the variable parts of a URL into a template key, e.g. host/products/{id}?page="""
+    parsed = parse_url(url)
+    segments = []
+    for segment in parsed.path.split('/'):
+        stem, dot, extension = segment.rpartition('.') if '.' in segment else (segment, '', '')
+        if _ID_SEGMENT.fullmatch(stem):
+            segments.append('{id}' + dot + extension)
+        elif stem.count('-') + stem.count('_') >= 2 or len(stem) > 40:
+            segments.append('{slug}' + dot + extension)
+        else:
+            segments.append(_DIGITS.sub('{n}', segment))
+    template = parsed.host + '/'.join(segments)
+    if parsed.query:
+        keys = sorted({key for key, _ in urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)})
+        template += '?' + '&'.join(f'{key}=' for key in keys)
+    return template
+
+
+def wilson_interval(hits: int, samples: int, z: float) -> Tuple[float, float]:
+    """Wilson score interval for a proportion; stays meaningful at 0 or n hits"""
+    if samples == 0:
+        return 0.0, 1.0
+    p = hits / samples
+    denominator = 1 + z * z / samples
+    center = (p + z * z / (2 * samples)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / samples + z * z / (4 * samples * samples)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+class SampleEstimates:
+    """Per-template sample counts and the prevalence estimates derived from them"""
+
+    def __init__(self, site_host: str, confidence: float = 0.95):
+        self.site_host = site_host
+        self.confidence = confidence
+        self.z = NormalDist().inv_cdf((1 + confidence) / 2)
+        self.population: Dict[str, Set[str]] = {}
+        self.sampled: Dict[str, int] = {}
+        self.dirty: Dict[str, int] = {}
+        self.requests = 0
+        self.elapsed = 0.0
+
+    def add_discovered(self, template: str, url: str):
+        self.population.setdefault(template, set()).add(url)
+
+    def add_sample(self, template: str, is_dirty: bool):
+        self.sampled[template] = self.sampled.get(template, 0) + 1
+        self.dirty[template] = self.dirty.get(template, 0) + int(is_dirty)
+
+    def template_estimate(self, template: str) -> Tuple[int, int, int, float, float, float]:
+        """Return (population, samples, dirty samples, estimate, low, high) for one template"""
+        population = len(self.population.get(template, ()))
+        samples = self.sampled.get(template, 0)
+        dirty = self.dirty.get(template, 0)
+        estimate = dirty / samples if samples else 0.0
+        if samples >= population:
+            # Every page of the template was scanned: nothing left to estimate
+            return population, samples, dirty, estimate, estimate, estimate
+        low, high = wilson_interval(dirty, samples, self.z)
+        return population, samples, dirty, estimate, low, high
+
+    def site_templates(self) -> List[str]:
+        """Sampled templates on the site's own host"""
+        return [template for template in self.sampled if template.split('/', 1)[0] == self.site_host]
+
+    def site_estimate(self) -> Tuple[int, float, float, float]:
+        """Population-weighted prevalence over the site's sampled templates: (pages, estimate, low, high).
+
+        The bounds combine the per-template intervals, which is conservative.
+        """
+        total = estimate = low = high = 0.0
+        for template in self.site_templates():
+            population, _, _, t_estimate, t_low, t_high = self.template_estimate(template)
+            total += population
+            estimate += population * t_estimate
+            low += population * t_low
+            high += population * t_high
+        if not total:
+            return 0, 0.0, 0.0, 0.0
+        return int(total), estimate / total, low / total, high / total
+
+    def write(self, fh: TextIO):
+        """Write the sampling section of the report"""
+        pages, estimate, low, high = self.site_estimate()
+        level = f"{self.confidence:.0%}"
+        fh.write("SAMPLING ESTIMATES:\n")
+        fh.write("-" * 40 + "\n")
+        fh.write(f"Pages Discovered On {self.site_host}: {pages}\n")
+        fh.write(f"Pages Sampled On {self.site_host}: {sum(self.sampled[t] for t in self.site_templates())}\n")
+        fh.write(f"Requests Made: {self.requests} in {self.elapsed:.1f}s\n")
+        fh.write(f"Estimated Prevalence: {estimate:.1%} ({level} CI {low:.1%} - {high:.1%}), "
+                 f"about {estimate * pages:.0f} pages\n")
+        for template in sorted(self.sampled, key=lambda t: -len(self.population.get(t, ()))):
+            population, samples, dirty, t_estimate, t_low, t_high = self.template_estimate(template)
+            fh.write(f"{template}: {dirty} of {samples} samples dirty, {population} pages discovered, "
+                     f"{t_estimate:.1%} ({level} CI {t_low:.1%} - {t_high:.1%})\n")
+        fh.write("\n")
+
+
+class SamplingCrawler:
+    """Crawl that fetches at most `per_template` pages of each path template and estimates prevalence"""
+
+    def __init__(self, scanner: PolyfillScanner, per_template: int = 5, max_pages: int = 1000,
+                 confidence: float = 0.95):
+        self.scanner = scanner
+        self.per_template = per_template
+        self.max_pages = max_pages
+        self.confidence = confidence
+
+    def scan_website(self, start_url: str, max_depth: int = 4, use_sitemaps: bool = False,
+                     sitemap_limit: int = 100000) -> ResultStore:
+        """Sampling equivalent of PolyfillScanner.scan_website; estimates are left on scanner.sample_estimates"""
+        scanner = self.scanner
+        if not scanner.is_valid_url(start_url):
+            raise ValueError(f"Invalid URL: {start_url}")
+
+        logger.info(f"Starting sampling polyfill.io scan of {start_url} ({self.per_template} pages per template)")
+        started = time.perf_counter()
+        start_url = scanner.resolve_redirects(start_url)
+        estimates = SampleEstimates(host_of(start_url), self.confidence)
+        scanner.sample_estimates = estimates
+        scanner.counters = ReportCounters()
+        if scanner.findings_db:
+            scanner.run_id = scanner.findings_db.start_run(start_url)
+
+        order = itertools.count()
+        frontier: List[Tuple[int, int, int, str]] = []  # (depth, priority, order, url)
+        selected: Dict[str, int] = {}
+        results: List[ScanResult] = []
+
+        # scan_page reports the page it actually fetched through on_page, on the worker's own thread
+        fetched = threading.local()
+        previous_on_page = scanner.on_page
+
+        def on_page(url: str, status_code: int, content_type: str):
+            fetched.page = (url, status_code, content_type)
+            if previous_on_page:
+                previous_on_page(url, status_code, content_type)
+
+        def sample_page(url: str, depth: int):
+            fetched.page = None
+            page_results, links = scanner.scan_page(url, max_depth, depth, None)
+            return page_results, links, fetched.page
+
+        def offer(url: str, depth: int, priority: int = 1):
+            if parse_url(url).path.lower().endswith(ASSET_EXTENSIONS):
+                return
+            template = path_template(url)
+            if url in estimates.population.get(template, ()):
+                return
+            estimates.add_discovered(template, url)
+            if selected.get(template, 0) < self.per_template:
+                selected[template] = selected.get(template, 0) + 1
+                heapq.heappush(frontier, (depth, priority, next(order), url))
+
+        offer(start_url, 0)
+        if use_sitemaps:
+            # Sitemaps give the best picture of each template's population
+            for seed in scanner.seed_from_sitemaps(start_url, sitemap_limit):
+                offer(seed, min(1, max_depth - 1))
+
+        scanner.on_page = on_page
+        try:
+            with ThreadPoolExecutor(max_workers=scanner.max_workers) as executor:
+                pending = {}
+                while frontier or pending:
+                    while frontier and len(pending) < scanner.max_workers and estimates.requests < self.max_pages:
+                        depth, _, _, url = heapq.heappop(frontier)
+                        estimates.requests += 1
+                        pending[executor.submit(sample_page, url, depth)] = (url, depth)
+                    if not pending:
+                        break
+
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        url, depth = pending.pop(future)
+                        try:
+                            page_results, links, page = future.result()
+                        except Exception as e:
+                            logger.error(f"Error scanning {url}: {e}", extra={'url': url})
+                            continue
+                        results.extend(page_results)
+                        # Only a new canonical page fetched as 2xx HTML is a sample: robots.txt skips,
+                        # redirects to pages already scanned, failed fetches and scripts are not.
+                        # It counts towards the template of the page that answered, after redirects.
+                        if page and 200 <= page[1] < 300 and 'text/html' in page[2]:
+                            template = path_template(page[0])
+                            estimates.add_discovered(template, page[0])
+                            estimates.add_sample(template, any(r.severity == 'HIGH' for r in page_results))
+                        for link in links:
+                            offer(link, depth + 1, scanner.link_priority(link, url))
+        finally:
+            scanner.on_page = previous_on_page
+
+        estimates.elapsed = time.perf_counter() - started
+        scanner.scan_results = ResultStore(results)
+        if scanner.findings_db:
+            scanner.findings_db.finish_run(scanner.run_id, len(scanner.visited_urls), len(scanner.scan_results))
+            scanner.run_id = None
+
+        pages, estimate, low, high = estimates.site_estimate()
+        logger.info(f"Sampling scan completed: {estimates.requests} requests, {pages} pages discovered, "
+                    f"estimated prevalence {estimate:.1%} ({low:.1%} - {high:.1%})")
+        return scanner.scan_results
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Scan Logging
+Asynchronous logging pipeline for the scanner CLIs.
+
+Log calls in crawl threads only put the record on a queue; a listener thread
+formats it and writes it to the console and the log file, so workers never wait
+on file or terminal I/O under the logging lock. Records can be written as text
+or as JSON lines, and per-URL lines (those logged with extra={'url': ...}) can be
+sampled to keep the volume of large crawls manageable.
+
+Nothing is configured on import; embedding the scanner as a library adds no
+handlers. The CLIs call configure_logging() from main().
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import multiprocessing
+import zlib
+from datetime import datetime
+from typing import Optional
+
+DEFAULT_LOG_FILE = 'polyfill_scan.log'
+TEXT_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_worker_config: Optional[tuple] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, with the URL of per-URL records as its own field"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            'time': datetime.fromtimestamp(record.created).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'process': record.processName,
+            'message': record.getMessage(),
+        }
+        url = getattr(record, 'url', None)
+        if url is not None:
+            data['url'] = url
+        return json.dumps(data, ensure_ascii=False)
+
+
+class UrlSampleFilter(logging.Filter):
+    """Keep a fixed fraction of per-URL INFO/DEBUG lines; warnings and errors always pass.
+
+    The decision is a hash of the URL, so a sampled URL keeps all of its lines.
+    """
+
+    def __init__(self, rate: float = 1.0):
+        super().__init__()
+        self.threshold = int(max(0.0, min(1.0, rate)) * 0xFFFFFFFF)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        url = getattr(record, 'url', None)
+        if url is None or record.levelno > logging.INFO:
+            return True
+        return zlib.crc32(url.encode('utf-8', 'replace')) <= self.threshold
+
+
+def _install_queue_handler(log_queue, level: int, url_sample_rate: float):
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    handler = logging.handlers.QueueHandler(log_queue)
+    # Sample before enqueueing so dropped lines cost nothing downstream
+    handler.addFilter(UrlSampleFilter(url_sample_rate))
+    root.addHandler(handler)
+    root.setLevel(level)
+
+
+def configure_logging(log_file: Optional[str] = DEFAULT_LOG_FILE, level: int = logging.INFO,
+                      json_format: bool = False, url_sample_rate: float = 1.0) -> logging.handlers.QueueListener:
+    """Route all logging through a queue to console and file handlers run by a listener thread"""
+    global _listener, _worker_config
+    if _listener is not None:
+        _listener.stop()
+
+    formatter = JsonFormatter() if json_format else logging.Formatter(TEXT_FORMAT)
+    handlers = [logging.StreamHandler()]
+    if log_file:
+        handlers.append(logging.FileHandler(log_file))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # A multiprocessing queue also carries records from worker processes
+    log_queue = multiprocessing.Queue()
+    _install_queue_handler(log_queue, level, url_sample_rate)
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    _worker_config = (log_queue, level, url_sample_rate)
+    atexit.register(stop_logging)
+    return _listener
+
+
+def stop_logging():
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def worker_logging_config() -> Optional[tuple]:
+    """Picklable settings for configure_worker_logging in a child process, or None if logging is not configured"""
+    return _worker_config
+
+
+def configure_worker_logging(config: Optional[tuple]):
+    """Send a worker process's records to the parent's listener"""
+    if config is None:
+        return
+    log_queue, level, url_sample_rate = config
+    root = logging.getLogger()
+    if any(isinstance(handler, logging.handlers.QueueHandler) and handler.queue is log_queue
+           for handler in root.handlers):
+        return  # Inherited through fork
+    _install_queue_handler(log_queue, level, url_sample_rate)
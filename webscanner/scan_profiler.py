@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Scan Profiler
+Profile a scan across all of its threads and write output that can be attached to
+performance bug reports.
+
+Modes:
+    cprofile  deterministic cProfile of every thread started during the scan, merged
+              into one <prefix>.pstats, a <prefix>.txt summary and <prefix>.folded
+    sample    wall-clock sampling of every thread's stack (including time blocked
+              on the network) into <prefix>.folded
+
+The .folded files are collapsed stacks ("frame;frame;frame count"), the input
+format of flamegraph.pl, speedscope and inferno.
+
+Usage:
+    python malware_scanner.py https://example.com --profile slow-scan
+    python malware_scanner.py https://example.com --profile slow-scan --profile-mode sample
+    python -m pstats slow-scan.pstats
+"""
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+import re
+import sys
+import threading
+from collections import Counter
+from typing import Dict, List, TextIO, Tuple
+
+logger = logging.getLogger(__name__)
+
+PROFILE_MODES = ('cprofile', 'sample')
+
+# Pool threads are named like "ThreadPoolExecutor-3_0"; fold them together
+_THREAD_NUMBER = re.compile(r'[-_]\d+')
+
+
+def _frame_label(filename: str, lineno: int, funcname: str) -> str:
+    """Collapsed-stack frame name; ';' separates frames so it must not appear inside one"""
+    if filename == '~':
+        return funcname.replace(';', ',')
+    return f"{funcname} ({os.path.basename(filename)}:{lineno})".replace(';', ',')
+
+
+def write_collapsed(stats: pstats.Stats, fh: TextIO, min_microseconds: float = 1.0):
+    """Fold a cProfile call graph into collapsed stacks weighted in microseconds.
+
+    cProfile only records caller/callee edges, so each function's time is split
+    between the paths leading to it in proportion to the time spent on each edge.
+    """
+    entries = stats.stats
+    callees: Dict[tuple, List[Tuple[tuple, float]]] = {}
+    for func, (_, _, _, _, callers) in entries.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, []).append((func, edge[3]))
+
+    folded: Counter = Counter()
+
+    def walk(func: tuple, path: List[str], on_path: set, fraction: float):
+        _, _, self_time, total_time, _ = entries[func]
+        label = path + [_frame_label(*func)]
+        own = self_time * fraction * 1e6
+        if own >= min_microseconds:
+            folded[';'.join(label)] += own
+        if len(label) >= 256:
+            return
+        for callee, edge_time in callees.get(func, ()):
+            callee_total = entries[callee][3]
+            if callee in on_path or not callee_total:
+                continue
+            callee_fraction = edge_time * fraction / callee_total
+            if callee_total * callee_fraction * 1e6 < min_microseconds:
+                continue
+            walk(callee, label, on_path | {callee}, min(callee_fraction, 1.0))
+
+    for func, (_, _, _, _, callers) in entries.items():
+        if not callers:
+            walk(func, [], {func}, 1.0)
+
+    for stack, weight in sorted(folded.items()):
+        fh.write(f"{stack} {int(round(weight))}\n")
+
+
+class ScanProfiler:
+    """Context manager that profiles every thread of a scan, in cprofile or sample mode"""
+
+    def __init__(self, output_prefix: str, mode: str = 'cprofile', interval: float = 0.005):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode: {mode}")
+        self.output_prefix = output_prefix
+        self.mode = mode
+        self.interval = interval
+        self._profiles: List[cProfile.Profile] = []
+        self._lock = threading.Lock()
+        self._original_run = None
+        self._main_profile = None
+        self._samples: Counter = Counter()
+        self._sample_count = 0
+        self._stop = threading.Event()
+        self._sampler = None
+
+    def __enter__(self) -> 'ScanProfiler':
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    def start(self):
+        logger.info(f"Profiling scan ({self.mode} mode) to {self.output_prefix}.*")
+        if self.mode == 'sample':
+            self._sampler = threading.Thread(target=self._sample_loop, name='scan-profiler', daemon=True)
+            self._sampler.start()
+            return
+
+        # Each thread started during the scan runs under its own profiler
+        self._original_run = original_run = threading.Thread.run
+        profiler = self
+
+        def profiled_run(thread):
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # Python 3.12+ profiles every thread from the main thread's profiler
+                return original_run(thread)
+            try:
+                return original_run(thread)
+            finally:
+                profile.disable()
+                with profiler._lock:
+                    profiler._profiles.append(profile)
+
+        threading.Thread.run = profiled_run
+        self._main_profile = cProfile.Profile()
+        self._main_profile.enable()
+
+    def stop(self):
+        if self.mode == 'sample':
+            self._stop.set()
+            self._sampler.join()
+            self._write_samples()
+            return
+
+        self._main_profile.disable()
+        threading.Thread.run = self._original_run
+        stats = pstats.Stats(self._main_profile)
+        with self._lock:
+            for profile in self._profiles:
+                stats.add(profile)
+            threads = len(self._profiles)
+        self._write_stats(stats, threads)
+
+    def _write_stats(self, stats: pstats.Stats, threads: int):
+        stats.dump_stats(f"{self.output_prefix}.pstats")
+
+        summary = io.StringIO()
+        stats.stream = summary
+        stats.sort_stats('cumulative').print_stats(40)
+        stats.sort_stats('tottime').print_stats(20)
+        with open(f"{self.output_prefix}.txt", 'w', encoding='utf-8') as f:
+            f.write(f"Profiled threads: {threads + 1}\n")
+            f.write(summary.getvalue())
+
+        with open(f"{self.output_prefix}.folded", 'w', encoding='utf-8') as f:
+            write_collapsed(stats, f)
+        logger.info(f"Profile of main thread and {threads} worker threads written to "
+                    f"{self.output_prefix}.pstats, .txt and .folded")
+
+    def _sample_loop(self):
+        own_ident = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: _THREAD_NUMBER.sub('', thread.name) for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(_frame_label(code.co_filename, code.co_firstlineno, code.co_name))
+                    frame = frame.f_back
+                stack.append(names.get(ident, 'thread'))
+                self._samples[';'.join(reversed(stack))] += 1
+            self._sample_count += 1
+
+    def _write_samples(self):
+        with open(f"{self.output_prefix}.folded", 'w', encoding='utf-8') as f:
+            for stack, count in sorted(self._samples.items()):
+                f.write(f"{stack} {count}\n")
+        logger.info(f"{self._sample_count} wall-clock samples every {self.interval * 1000:.1f} ms "
+                    f"written to {self.output_prefix}.folded")
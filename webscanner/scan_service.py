@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Polyfill.io Scan Service
+Long-running daemon that keeps a warm PolyfillScanner engine (connection pool,
+robots.txt and redirect caches, compiled signatures) and accepts scan jobs over
+a local HTTP/JSON API, on TCP or a Unix socket.
+
+API:
+    POST   /jobs                 {"url": "...", "depth": 2, "sitemaps": false, "client": "acme"}
+    GET    /jobs                 list jobs
+    GET    /jobs/<id>            job status, counts and findings
+    GET    /jobs/<id>/results    stream findings as NDJSON while the job runs
+    DELETE /jobs/<id>            cancel a queued or running job
+    GET    /health               service status
+
+Usage:
+    python scan_service.py --port 8750 --job-workers 4
+    python scan_service.py --unix /run/polyfill-scan.sock
+"""
+
+import argparse
+import json
+import os
+import socketserver
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+from malware_scanner import PolyfillScanner, ScanResult, logger
+from scan_logging import configure_logging
+
+# Largest accepted request body
+MAX_REQUEST_BYTES = 64 * 1024
+
+
+def result_to_dict(result: ScanResult) -> dict:
+    """Serialize a finding the same way export_json does"""
+    return {
+        'url': result.url,
+        'threat_type': result.threat_type,
+        'description': result.description,
+        'severity': result.severity,
+        'details': result.details,
+        'timestamp': result.timestamp
+    }
+
+
+class ScanJob:
+    """A queued or running scan and the findings it has produced so far"""
+
+    def __init__(self, url: str, client: str, depth: int = 2, sitemaps: bool = False, sitemap_limit: int = 500):
+        self.id = uuid.uuid4().hex[:12]
+        self.url = url
+        self.client = client
+        self.depth = depth
+        self.sitemaps = sitemaps
+        self.sitemap_limit = sitemap_limit
+        self.status = 'queued'
+        self.error = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.urls_scanned = 0
+        self.findings: List[dict] = []
+        self.changed = threading.Condition()
+        self.scanner: Optional[PolyfillScanner] = None  # set while running, for cancellation
+        self.cancel_requested = False
+
+    def add_findings(self, results: List[ScanResult]):
+        with self.changed:
+            self.findings.extend(result_to_dict(result) for result in results)
+            self.changed.notify_all()
+
+    def set_status(self, status: str, error: Optional[str] = None):
+        with self.changed:
+            self.status = status
+            self.error = error
+            if status == 'running':
+                self.started = time.time()
+            elif status in ('done', 'failed', 'cancelled'):
+                self.finished = time.time()
+            self.changed.notify_all()
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in ('done', 'failed', 'cancelled')
+
+    def summary(self, include_findings: bool = False) -> dict:
+        data = {
+            'id': self.id,
+            'url': self.url,
+            'client': self.client,
+            'depth': self.depth,
+            'status': self.status,
+            'error': self.error,
+            'created': self.created,
+            'started': self.started,
+            'finished': self.finished,
+            'urls_scanned': self.urls_scanned,
+            'finding_count': len(self.findings),
+        }
+        if include_findings:
+            data['findings'] = list(self.findings)
+        return data
+
+
+class FairJobQueue:
+    """Job queue that round-robins between clients so one large batch cannot starve the others"""
+
+    def __init__(self):
+        self._lock = threading.Condition()
+        self._queues: 'OrderedDict[str, deque]' = OrderedDict()
+
+    def put(self, job: ScanJob):
+        with self._lock:
+            self._queues.setdefault(job.client, deque()).append(job)
+            self._lock.notify()
+
+    def get(self) -> ScanJob:
+        """Block until a job is available; take it from the client that has waited longest"""
+        with self._lock:
+            while not self._queues:
+                self._lock.wait()
+            client, jobs = next(iter(self._queues.items()))
+            job = jobs.popleft()
+            # Rotate the client to the back of the line
+            del self._queues[client]
+            if jobs:
+                self._queues[client] = jobs
+            return job
+
+    def remove(self, job: ScanJob) -> bool:
+        with self._lock:
+            jobs = self._queues.get(job.client)
+            if not jobs or job not in jobs:
+                return False
+            jobs.remove(job)
+            if not jobs:
+                del self._queues[job.client]
+            return True
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(jobs) for jobs in self._queues.values())
+
+
+class ScanService:
+    """Warm scan engine plus a pool of job workers"""
+
+    def __init__(self, engine: PolyfillScanner, job_workers: int = 2, max_jobs_kept: int = 1000):
+        self.engine = engine
+        self.queue = FairJobQueue()
+        self.jobs: 'OrderedDict[str, ScanJob]' = OrderedDict()
+        self.max_jobs_kept = max_jobs_kept
+        self._jobs_lock = threading.Lock()
+        self.started = time.time()
+        self._workers = [
+            threading.Thread(target=self._work, name=f'scan-job-{i}', daemon=True)
+            for i in range(job_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, job: ScanJob) -> ScanJob:
+        with self._jobs_lock:
+            self.jobs[job.id] = job
+            # Forget the oldest finished jobs
+            while len(self.jobs) > self.max_jobs_kept:
+                oldest = next((j for j in self.jobs.values() if j.is_finished), None)
+                if oldest is None:
+                    break
+                del self.jobs[oldest.id]
+        self.queue.put(job)
+        logger.info(f"Queued job {job.id} for {job.url} (client {job.client})")
+        return job
+
+    def get(self, job_id: str) -> Optional[ScanJob]:
+        with self._jobs_lock:
+            return self.jobs.get(job_id)
+
+    def list(self) -> List[ScanJob]:
+        with self._jobs_lock:
+            return list(self.jobs.values())
+
+    def cancel(self, job: ScanJob) -> bool:
+        """Drop a queued job, or stop a running one; return False if the job already finished"""
+        if self.queue.remove(job):
+            job.set_status('cancelled')
+            return True
+        with job.changed:
+            if job.is_finished:
+                return False
+            # A job taken off the queue but not started yet is cancelled by its worker
+            job.cancel_requested = True
+            if job.scanner is not None:
+                job.scanner.cancel_event.set()
+        logger.info(f"Cancelling job {job.id}")
+        return True
+
+    def _work(self):
+        while True:
+            job = self.queue.get()
+            scanner = self.engine.copy_engine()
+            scanner.on_results = job.add_findings
+            with job.changed:
+                if job.cancel_requested:
+                    job.set_status('cancelled')
+                    continue
+                job.scanner = scanner
+                job.set_status('running')
+            try:
+                scanner.scan_website(job.url, max_depth=job.depth, use_sitemaps=job.sitemaps,
+                                     sitemap_limit=job.sitemap_limit)
+                job.urls_scanned = len(scanner.visited_urls)
+                job.set_status('cancelled' if job.cancel_requested else 'done')
+            except Exception as e:
+                logger.error(f"Job {job.id} failed: {e}")
+                job.set_status('failed', str(e))
+            finally:
+                job.scanner = None
+
+
+class ScanRequestHandler(BaseHTTPRequestHandler):
+    """JSON API over the ScanService held by the server"""
+
+    server_version = 'PolyfillScanService/1.0'
+    # Needed for the chunked results stream; every other response carries a Content-Length
+    protocol_version = 'HTTP/1.1'
+
+    @property
+    def service(self) -> ScanService:
+        return self.server.service
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port) address
+        return self.client_address[0] if isinstance(self.client_address, tuple) else 'unix'
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+    def _send_json(self, status: int, data, close: bool = False):
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if close:
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _path_parts(self) -> List[str]:
+        return [part for part in self.path.split('?', 1)[0].split('/') if part]
+
+    def do_GET(self):
+        parts = self._path_parts()
+        if parts == ['health']:
+            self._send_json(200, {
+                'status': 'ok',
+                'uptime': time.time() - self.service.started,
+                'queued': len(self.service.queue),
+                'jobs': len(self.service.jobs),
+            })
+        elif parts == ['jobs']:
+            self._send_json(200, [job.summary() for job in self.service.list()])
+        elif len(parts) == 2 and parts[0] == 'jobs':
+            job = self.service.get(parts[1])
+            if job is None:
+                self._send_json(404, {'error': 'job not found'})
+            else:
+                self._send_json(200, job.summary(include_findings=True))
+        elif len(parts) == 3 and parts[0] == 'jobs' and parts[2] == 'results':
+            job = self.service.get(parts[1])
+            if job is None:
+                self._send_json(404, {'error': 'job not found'})
+            else:
+                self._stream_results(job)
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+    def do_POST(self):
+        if self._path_parts() != ['jobs']:
+            self._send_json(404, {'error': 'not found'})
+            return
+
+        length = int(self.headers.get('Content-Length', 0))
+        if length > MAX_REQUEST_BYTES:
+            # The body is left unread, so the connection cannot carry another request
+            self._send_json(413, {'error': 'request too large'}, close=True)
+            return
+        try:
+            request = json.loads(self.rfile.read(length) or b'{}')
+            url = request['url']
+            if not self.service.engine.is_valid_url(url):
+                raise ValueError(f"Invalid URL: {url}")
+            job = ScanJob(
+                url=url,
+                client=str(request.get('client') or self.address_string()),
+                depth=int(request.get('depth', 2)),
+                sitemaps=bool(request.get('sitemaps', False)),
+                sitemap_limit=int(request.get('sitemap_limit', 500)),
+            )
+        except (KeyError, ValueError, TypeError) as e:
+            self._send_json(400, {'error': f'bad request: {e}'})
+            return
+
+        self.service.submit(job)
+        self._send_json(202, job.summary())
+
+    def do_DELETE(self):
+        parts = self._path_parts()
+        job = self.service.get(parts[1]) if len(parts) == 2 and parts[0] == 'jobs' else None
+        if job is None:
+            self._send_json(404, {'error': 'job not found'})
+        elif self.service.cancel(job):
+            self._send_json(200, job.summary())
+        else:
+            self._send_json(409, {'error': f'job is already {job.status}'})
+
+    def _stream_results(self, job: ScanJob):
+        """Send findings as NDJSON lines as they are produced, then a final status line"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+
+        def send_line(data: dict):
+            line = (json.dumps(data, ensure_ascii=False) + '\n').encode('utf-8')
+            self.wfile.write(f'{len(line):x}\r\n'.encode('ascii') + line + b'\r\n')
+            self.wfile.flush()
+
+        sent = 0
+        try:
+            while True:
+                with job.changed:
+                    while sent == len(job.findings) and not job.is_finished:
+                        job.changed.wait(timeout=15)
+                    pending = job.findings[sent:]
+                    finished = job.is_finished
+                for finding in pending:
+                    send_line({'event': 'finding', **finding})
+                sent += len(pending)
+                if finished and sent == len(job.findings):
+                    break
+            send_line({'event': 'status', **job.summary()})
+            self.wfile.write(b'0\r\n\r\n')
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """HTTP server on a Unix domain socket"""
+    daemon_threads = True
+
+
+def main():
+    """Main function with command-line interface"""
+    parser = argparse.ArgumentParser(description='Polyfill.io scan service')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8750, help='TCP port to listen on (default: 8750)')
+    parser.add_argument('--unix', help='Listen on this Unix socket path instead of TCP')
+    parser.add_argument('--job-workers', type=int, default=2, help='Scan jobs run concurrently (default: 2)')
+    parser.add_argument('--workers', type=int, default=5, help='Crawl threads per job (default: 5)')
+    parser.add_argument('--delay', type=float, default=1.0, help='Delay between requests in seconds (default: 1.0)')
+    parser.add_argument('--bypass-robots', action='store_true', help='Bypass robots.txt restrictions (use with caution)')
+    args = parser.parse_args()
+    configure_logging()
+
+    engine = PolyfillScanner(max_workers=args.workers, delay=args.delay, bypass_robots=args.bypass_robots)
+    service = ScanService(engine, job_workers=args.job_workers)
+
+    if args.unix:
+        if os.path.exists(args.unix):
+            os.unlink(args.unix)
+        server = ThreadingUnixHTTPServer(args.unix, ScanRequestHandler)
+        where = args.unix
+    else:
+        server = ThreadingHTTPServer((args.host, args.port), ScanRequestHandler)
+        where = f"http://{args.host}:{args.port}"
+    server.service = service
+
+    logger.info(f"Scan service listening on {where} with {args.job_workers} job workers")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Scan service stopped")
+    finally:
+        server.server_close()
+        if args.unix and os.path.exists(args.unix):
+            os.unlink(args.unix)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Streaming Scan API
+Embed the scanner in automation and act on findings while the crawl is still running.
+
+iter_scan() crawls each target in a background thread and yields ScanEvents as they
+happen: 'start' and 'finish' for each target, 'page' after every fetch, 'finding' for
+every result and 'error' when a target cannot be scanned. Events pass through a
+bounded buffer, so a slow consumer holds the crawl back instead of letting events
+pile up, and findings are not accumulated, so memory stays flat on long crawls.
+Breaking out of the loop, closing the stream or calling cancel() stops the crawl and
+aborts downloads in flight. The same stream can be consumed with `async for`.
+
+Usage:
+    from scan_stream import ScanOptions, iter_scan
+
+    with iter_scan(['https://example.com'], ScanOptions(depth=3)) as stream:
+        for event in stream:
+            if event.kind == 'finding' and event.result.severity == 'HIGH':
+                alert(event.result)
+                stream.cancel()
+
+    async for event in iter_scan(targets, ScanOptions(depth=2, delay=0.5)):
+        ...
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from typing import AsyncIterator, Iterable, Iterator, List, Optional
+
+from malware_scanner import DEFAULT_MAX_BODY_BYTES, PolyfillScanner, ScanResult, logger
+
+# Marks the end of the stream in the buffer
+_DONE = object()
+
+
+class ScanOptions:
+    """Crawl settings for iter_scan"""
+
+    def __init__(self, depth: int = 2, sitemaps: bool = False, sitemap_limit: int = 500, workers: int = 5,
+                 delay: float = 1.0, bypass_robots: bool = False, max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+                 buffer_size: int = 256):
+        self.depth = depth
+        self.sitemaps = sitemaps
+        self.sitemap_limit = sitemap_limit
+        self.workers = workers
+        self.delay = delay
+        self.bypass_robots = bypass_robots
+        self.max_body_bytes = max_body_bytes
+        self.buffer_size = buffer_size
+
+
+class ScanEvent:
+    """One item of a streaming scan: a finding or a progress update for a target"""
+
+    def __init__(self, kind: str, target: str, url: Optional[str] = None, result: Optional[ScanResult] = None,
+                 status_code: int = 0, pages: int = 0, findings: int = 0, error: Optional[str] = None,
+                 content_type: str = ''):
+        self.kind = kind
+        self.target = target
+        self.url = url
+        self.result = result
+        self.status_code = status_code
+        self.content_type = content_type
+        self.pages = pages
+        self.findings = findings
+        self.error = error
+        self.time = time.time()
+
+    def __repr__(self):
+        return f"ScanEvent({self.kind!r}, {self.url or self.target!r}, pages={self.pages}, findings={self.findings})"
+
+
+class ScanStream:
+    """Iterator and async iterator over the events of a background scan"""
+
+    def __init__(self, targets: Iterable[str], options: ScanOptions, engine: PolyfillScanner):
+        self.targets = list(targets)
+        self.options = options
+        self.engine = engine
+        self._buffer: queue.Queue = queue.Queue(maxsize=max(1, options.buffer_size))
+        self._cancelled = threading.Event()
+        self._scanner: Optional[PolyfillScanner] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _put(self, item) -> bool:
+        """Wait for room in the buffer; give up once the stream is cancelled"""
+        while True:
+            try:
+                self._buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                if self._cancelled.is_set():
+                    return False
+
+    def _run(self):
+        try:
+            for target in self.targets:
+                if self._cancelled.is_set():
+                    break
+                self._scan_target(target)
+        finally:
+            self._put(_DONE)
+
+    def _scan_target(self, target: str):
+        scanner = self.engine.copy_engine()
+        with self._lock:
+            if self._cancelled.is_set():
+                return
+            self._scanner = scanner
+        pages = 0
+        findings = 0
+        counts_lock = threading.Lock()
+
+        def on_page(url: str, status_code: int, content_type: str):
+            nonlocal pages
+            with counts_lock:
+                pages += 1
+                count = pages
+            self._put(ScanEvent('page', target, url=url, status_code=status_code, pages=count,
+                                content_type=content_type))
+
+        def on_results(results: List[ScanResult]):
+            nonlocal findings
+            for result in results:
+                with counts_lock:
+                    findings += 1
+                if not self._put(ScanEvent('finding', target, url=result.url, result=result)):
+                    return
+
+        scanner.on_page = on_page
+        scanner.on_results = on_results
+        self._put(ScanEvent('start', target))
+        try:
+            scanner.scan_website(target, max_depth=self.options.depth, use_sitemaps=self.options.sitemaps,
+                                 sitemap_limit=self.options.sitemap_limit, keep_results=False)
+        except Exception as e:
+            logger.error(f"Streaming scan of {target} failed: {e}")
+            self._put(ScanEvent('error', target, error=str(e), pages=pages, findings=findings))
+            return
+        finally:
+            with self._lock:
+                self._scanner = None
+        self._put(ScanEvent('finish', target, pages=pages, findings=findings))
+
+    def start(self) -> 'ScanStream':
+        """Start the background crawl; iterating starts it implicitly"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='polyfill-scan-stream', daemon=True)
+            self._thread.start()
+        return self
+
+    def cancel(self):
+        """Stop the crawl: queued fetches are dropped and downloads in flight are aborted"""
+        with self._lock:
+            self._cancelled.set()
+            if self._scanner is not None:
+                self._scanner.cancel_event.set()
+
+    def close(self):
+        """Cancel the crawl and wait for the background thread to finish"""
+        self.cancel()
+        if self._thread is not None:
+            # Unblock a producer waiting on a full buffer
+            while self._thread.is_alive():
+                try:
+                    self._buffer.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            self._thread = None
+            # Wake a reader still blocked in _get (an async consumer that was cancelled mid-wait)
+            try:
+                self._buffer.put_nowait(_DONE)
+            except queue.Full:
+                pass
+
+    def _get(self):
+        return self._buffer.get()
+
+    def __iter__(self) -> Iterator[ScanEvent]:
+        self.start()
+        try:
+            while True:
+                event = self._get()
+                if event is _DONE or self._cancelled.is_set():
+                    return
+                yield event
+        finally:
+            self.close()
+
+    async def _aiterate(self) -> AsyncIterator[ScanEvent]:
+        self.start()
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                event = await loop.run_in_executor(None, self._get)
+                if event is _DONE or self._cancelled.is_set():
+                    return
+                yield event
+        finally:
+            await loop.run_in_executor(None, self.close)
+
+    def __aiter__(self) -> AsyncIterator[ScanEvent]:
+        return self._aiterate()
+
+    def __enter__(self) -> 'ScanStream':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def iter_scan(targets: Iterable[str], options: Optional[ScanOptions] = None,
+              engine: Optional[PolyfillScanner] = None) -> ScanStream:
+    """Stream findings and progress events for targets, scanned one after another.
+
+    Pass a warm engine to reuse its session, caches and signatures across streams.
+    """
+    options = options or ScanOptions()
+    if engine is None:
+        engine = PolyfillScanner(max_workers=options.workers, delay=options.delay,
+                                 bypass_robots=options.bypass_robots, max_body_bytes=options.max_body_bytes)
+    return ScanStream(targets, options, engine)
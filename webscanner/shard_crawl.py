@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Sharded Crawl Coordinator
+Runs one crawl across several worker processes so a large scan is not limited by
+one interpreter (GIL) and one HTTP session.
+
+Every URL belongs to exactly one shard, chosen by a consistent hash of its host,
+so each shard keeps its own session, robots.txt cache and politeness delay for the
+hosts it owns, and its visited set is authoritative for them. Shards crawl their
+own links locally and hand links for other hosts to the coordinator, which acts
+as the broker: it routes them to the owning shard's queue, merges findings,
+fetch records and transfer metrics, and detects when the crawl is finished.
+
+Usage:
+    python malware_scanner.py https://example.com --shards 4 --workers 8
+"""
+
+import bisect
+import hashlib
+import multiprocessing
+import queue
+import threading
+import time
+from typing import List, Optional, Set, Tuple
+
+from malware_scanner import PolyfillScanner, ReportCounters, ResultStore, ScanResult, logger
+from memory_budget import MemoryBudget, current_rss
+from url_model import host_of
+from scan_logging import configure_worker_logging, worker_logging_config
+
+
+def _ring_hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+class HashRing:
+    """Consistent hash of hosts onto shards; adding a shard only moves about 1/N of the hosts"""
+
+    def __init__(self, shards: int, replicas: int = 64):
+        self.shards = shards
+        points = sorted((_ring_hash(f'{shard}:{replica}'), shard)
+                        for shard in range(shards) for replica in range(replicas))
+        self._keys = [key for key, _ in points]
+        self._shards = [shard for _, shard in points]
+
+    def shard_for_host(self, host: str) -> int:
+        index = bisect.bisect(self._keys, _ring_hash(host)) % len(self._keys)
+        return self._shards[index]
+
+    def shard_for(self, url: str) -> int:
+        return self.shard_for_host(host_of(url))
+
+
+class _FetchLog:
+    """Stand-in findings database for shard processes: collects fetch rows for the coordinator"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.rows: List[Tuple[str, int, Optional[str]]] = []
+
+    def add_fetch(self, run_id: int, url: str, status: int, content_hash: Optional[str]):
+        with self._lock:
+            self.rows.append((url, status, content_hash))
+
+    def add_findings(self, run_id: int, results):
+        # Findings reach the coordinator with each page's results and are recorded there
+        pass
+
+    def drain(self) -> List[Tuple[str, int, Optional[str]]]:
+        with self._lock:
+            rows, self.rows = self.rows, []
+            return rows
+
+
+def _shard_main(shard_id: int, ring: HashRing, inbox, outbox, options: dict):
+    """Shard process: crawl the tasks routed to this shard with a pool of threads.
+
+    Every task taken from the inbox or spawned locally is acknowledged with exactly
+    one 'done' message, which also carries the links handed to other shards and the
+    number of tasks spawned locally, so the coordinator can count outstanding work.
+    """
+    configure_worker_logging(options['log_config'])
+    budget = options['memory_budget_bytes']
+    scanner = PolyfillScanner(max_workers=options['workers'], delay=options['delay'],
+                              bypass_robots=options['bypass_robots'], max_body_bytes=options['max_body_bytes'],
+                              memory_budget=MemoryBudget(budget) if budget else None)
+    scanner.threat_patterns = options['threat_patterns']
+    scanner.malicious_domains = options['malicious_domains']
+    scanner.redirect_cache.update(options['redirect_cache'])
+    fetch_log = None
+    if options['run_id'] is not None:
+        fetch_log = _FetchLog()
+        scanner.findings_db = fetch_log
+        scanner.run_id = options['run_id']
+
+    max_depth = options['max_depth']
+    frontier: queue.Queue = queue.Queue()
+    claimed: Set[str] = set()
+    claimed_lock = threading.Lock()
+
+    def work():
+        while True:
+            task = frontier.get()
+            if task is None:
+                return
+            url, depth = task
+            results, links = [], []
+            try:
+                results, links = scanner.scan_page(url, max_depth, depth)
+            except Exception as e:
+                logger.error(f"Error scanning {url}: {e}", extra={'url': url})
+
+            local, remote = [], []
+            for link in links:
+                if ring.shard_for(link) != shard_id:
+                    remote.append((link, depth + 1))
+                    continue
+                with claimed_lock:
+                    if link in claimed:
+                        continue
+                    claimed.add(link)
+                local.append((link, depth + 1))
+
+            # Acknowledge before queueing local tasks, so their acks cannot overtake this one
+            fetches = fetch_log.drain() if fetch_log else []
+            outbox.put(('done', shard_id, results, fetches, remote, len(local)))
+            for task in local:
+                frontier.put(task)
+
+    threads = [threading.Thread(target=work, name=f'shard-{shard_id}-{i}', daemon=True)
+               for i in range(options['workers'])]
+    for thread in threads:
+        thread.start()
+
+    while True:
+        task = inbox.get()
+        if task is None:
+            break
+        with claimed_lock:
+            claimed.add(task[0])
+        frontier.put(task)
+
+    for _ in threads:
+        frontier.put(None)
+    for thread in threads:
+        thread.join()
+
+    scanner.metrics.record_memory(current_rss())
+    if scanner.memory_budget:
+        scanner.metrics.body_waits = scanner.memory_budget.body_waits
+    outbox.put(('final', shard_id, scanner.metrics.snapshot(), list(scanner.visited_urls),
+                scanner.script_graph, scanner.redirect_cache))
+
+
+class ShardedCrawler:
+    """Coordinator that runs a PolyfillScanner crawl across shard processes and merges the results into it"""
+
+    def __init__(self, scanner: PolyfillScanner, shards: int = 2):
+        if scanner.recorder is not None:
+            raise ValueError("Recording a WARC archive is not supported with sharded crawls")
+        self.scanner = scanner
+        self.shards = shards
+        self.ring = HashRing(shards)
+
+    def scan_website(self, start_url: str, max_depth: int = 2, use_sitemaps: bool = False,
+                     sitemap_limit: int = 500) -> ResultStore:
+        """Sharded equivalent of PolyfillScanner.scan_website"""
+        scanner = self.scanner
+        if not scanner.is_valid_url(start_url):
+            raise ValueError(f"Invalid URL: {start_url}")
+
+        logger.info(f"Starting sharded polyfill.io scan of {start_url} across {self.shards} shards")
+        started = time.perf_counter()
+        scanner.counters = ReportCounters()
+        if scanner.findings_db:
+            scanner.run_id = scanner.findings_db.start_run(start_url)
+
+        options = {
+            'workers': scanner.max_workers,
+            'delay': scanner.delay,
+            'bypass_robots': scanner.bypass_robots,
+            'max_body_bytes': scanner.max_body_bytes,
+            # Each shard process holds back downloads within its share of the budget
+            'memory_budget_bytes': scanner.memory_budget.limit_bytes // self.shards if scanner.memory_budget else None,
+            'threat_patterns': scanner.threat_patterns,
+            'malicious_domains': scanner.malicious_domains,
+            'redirect_cache': dict(scanner.redirect_cache),
+            'run_id': scanner.run_id,
+            'max_depth': max_depth,
+            'log_config': worker_logging_config(),
+        }
+        outbox = multiprocessing.Queue()
+        inboxes = [multiprocessing.Queue() for _ in range(self.shards)]
+        processes = [
+            multiprocessing.Process(target=_shard_main, name=f'polyfill-shard-{shard}',
+                                    args=(shard, self.ring, inboxes[shard], outbox, options), daemon=True)
+            for shard in range(self.shards)
+        ]
+        for process in processes:
+            process.start()
+
+        results: List[ScanResult] = []
+        routed: Set[str] = set()
+        outstanding = 0
+
+        def receive() -> tuple:
+            # A shard that died would otherwise leave the coordinator waiting forever
+            while True:
+                try:
+                    return outbox.get(timeout=1.0)
+                except queue.Empty:
+                    dead = [process.name for process in processes if process.exitcode not in (None, 0)]
+                    if dead:
+                        raise RuntimeError(f"Shard process failed: {', '.join(dead)}")
+
+        def route(url: str, depth: int):
+            nonlocal outstanding
+            if url in routed:
+                return
+            routed.add(url)
+            outstanding += 1
+            inboxes[self.ring.shard_for(url)].put((url, depth))
+
+        try:
+            route(scanner.resolve_redirects(start_url), 0)
+            if use_sitemaps:
+                # Scan sitemap URLs as if they were linked from the start page
+                for seed in scanner.seed_from_sitemaps(start_url, sitemap_limit):
+                    route(seed, min(1, max_depth - 1))
+
+            while outstanding:
+                _, shard, page_results, fetches, remote, spawned = receive()
+                outstanding += spawned - 1
+                for link, depth in remote:
+                    route(link, depth)
+
+                if page_results:
+                    results.extend(page_results)
+                    scanner.counters.record(page_results)
+                    if scanner.on_results:
+                        scanner.on_results(page_results)
+                if scanner.findings_db and scanner.run_id is not None:
+                    for url, status, content_hash in fetches:
+                        scanner.findings_db.add_fetch(scanner.run_id, url, status, content_hash)
+                    scanner.findings_db.add_findings(scanner.run_id, page_results)
+
+            # Every task is acknowledged: stop the shards and merge their state
+            for inbox in inboxes:
+                inbox.put(None)
+            for _ in processes:
+                _, shard, metrics, visited, script_graph, redirect_cache = receive()
+                scanner.metrics.merge(metrics)
+                scanner.visited_urls.update(visited)
+                for source, targets in script_graph.items():
+                    scanner.script_graph.setdefault(source, set()).update(targets)
+                scanner.redirect_cache.update(redirect_cache)
+            for process in processes:
+                process.join()
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+
+        scanner.scan_results = ResultStore(results)
+        scanner.metrics.record_memory(current_rss())
+        if scanner.findings_db:
+            scanner.findings_db.finish_run(scanner.run_id, len(scanner.visited_urls), len(scanner.scan_results))
+            scanner.run_id = None
+
+        elapsed = time.perf_counter() - started
+        logger.info(f"Sharded scan completed in {elapsed:.1f}s: {len(scanner.visited_urls)} URLs "
+                    f"({len(scanner.visited_urls) / elapsed:.1f}/s), {len(results)} polyfill.io references.")
+        return scanner.scan_results
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+URL Model
+Parse and canonicalize each URL string once and share the result between link
+extraction, dedup, scope, robots.txt, metrics and sharding.
+
+parse_url() is backed by a bounded LRU cache keyed on the raw string, so the many
+repeats of the same link on a site (navigation, footers, script tags) cost one
+dictionary lookup after the first parse. ParsedUrl is slotted and immutable, and
+its canonical string and host are interned so dedup sets and counters share them.
+"""
+
+import sys
+import urllib.parse
+from functools import lru_cache
+from typing import Optional
+
+# Distinct URL strings kept parsed
+URL_CACHE_SIZE = 65536
+
+_DEFAULT_PORTS = {'http': '80', 'https': '443'}
+
+
+class ParsedUrl:
+    """Canonical, parsed URL: fragment dropped, scheme and host lower-cased, default port removed"""
+    __slots__ = ('url', 'scheme', 'host', 'hostname', 'path', 'query', '_hash')
+
+    def __init__(self, url: str, scheme: str, host: str, hostname: str, path: str, query: str):
+        self.url = sys.intern(url)
+        self.scheme = scheme
+        self.host = sys.intern(host)
+        self.hostname = hostname
+        self.path = path
+        self.query = query
+        self._hash = hash(self.url)
+
+    @property
+    def origin(self) -> str:
+        return f"{self.scheme}://{self.host}"
+
+    @property
+    def is_http(self) -> bool:
+        return self.scheme in ('http', 'https') and bool(self.host)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other):
+        if isinstance(other, ParsedUrl):
+            return self.url == other.url
+        return NotImplemented
+
+    def __str__(self) -> str:
+        return self.url
+
+    def __repr__(self) -> str:
+        return f"ParsedUrl({self.url!r})"
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def _parse_absolute(url: str) -> ParsedUrl:
+    parts = urllib.parse.urlsplit(url)
+    scheme = parts.scheme.lower()
+    hostname = parts.hostname or ''
+    host = parts.netloc.lower()
+    port = parts.port  # raises ValueError for malformed ports
+    if port is not None and str(port) == _DEFAULT_PORTS.get(scheme):
+        host = host.rsplit(':', 1)[0]
+    canonical = urllib.parse.urlunsplit((scheme, host, parts.path, parts.query, ''))
+    return ParsedUrl(canonical, scheme, host, hostname, parts.path, parts.query)
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def _join(base_url: str, url: str) -> str:
+    return urllib.parse.urljoin(base_url, url)
+
+
+def parse_url(url: str, base_url: Optional[str] = None) -> Optional[ParsedUrl]:
+    """Resolve url against base_url if it is relative and parse it; None if it cannot be parsed"""
+    try:
+        if base_url and not url.startswith(('http://', 'https://')):
+            url = _join(base_url, url)
+        return _parse_absolute(url)
+    except ValueError:
+        return None
+
+
+def host_of(url: str) -> str:
+    """Lower-cased host (with any non-default port) of a URL, '' if it cannot be parsed"""
+    parsed = parse_url(url)
+    return parsed.host if parsed else ''
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+WARC Archive
+Record fetched responses to a compressed WARC file with an offset index, and read
+them back with memory-mapped access so past crawls can be rescanned offline.
+
+Each record is written as its own gzip member (the usual .warc.gz layout), and a
+JSON-lines index next to the archive (`<archive>.idx`) maps every URL to the
+offset and length of its member.
+"""
+
+import gzip
+import json
+import mmap
+import os
+import threading
+import uuid
+import zlib
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Headers that describe the wire encoding rather than the stored (decoded) body
+_HOP_HEADERS = {'content-encoding', 'transfer-encoding', 'content-length', 'connection'}
+
+
+def _warc_date() -> str:
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _warc_record(warc_type: str, headers: Dict[str, str], block: bytes) -> bytes:
+    lines = [
+        'WARC/1.1',
+        f'WARC-Type: {warc_type}',
+        f'WARC-Record-ID: <urn:uuid:{uuid.uuid4()}>',
+        f'WARC-Date: {_warc_date()}',
+    ]
+    lines.extend(f'{name}: {value}' for name, value in headers.items())
+    lines.append(f'Content-Length: {len(block)}')
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('utf-8') + block + b'\r\n\r\n'
+
+
+class WarcWriter:
+    """Append-only, thread-safe writer of gzipped WARC response records"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.index_path = path + '.idx'
+        self._lock = threading.Lock()
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file = open(path, 'ab')
+        self._index = open(self.index_path, 'a', encoding='utf-8')
+        if is_new:
+            info = b'software: polyfill.io scanner\r\nformat: WARC File Format 1.1\r\n'
+            self._append(_warc_record('warcinfo', {'Content-Type': 'application/warc-fields'}, info))
+
+    def _append(self, record: bytes) -> Tuple[int, int]:
+        member = gzip.compress(record)
+        offset = self._file.seek(0, os.SEEK_END)
+        self._file.write(member)
+        return offset, len(member)
+
+    def write_response(self, url: str, status: int, reason: str, headers: Dict[str, str], body: bytes):
+        """Store one HTTP response (body already decoded) and index it by URL"""
+        http_lines = [f'HTTP/1.1 {status} {reason or ""}'.rstrip()]
+        http_lines.extend(f'{name}: {value}' for name, value in headers.items()
+                          if name.lower() not in _HOP_HEADERS)
+        http_lines.append(f'Content-Length: {len(body)}')
+        block = ('\r\n'.join(http_lines) + '\r\n\r\n').encode('latin-1', 'replace') + body
+
+        record = _warc_record('response', {
+            'WARC-Target-URI': url,
+            'Content-Type': 'application/http;msgtype=response',
+        }, block)
+
+        content_type = next((value for name, value in headers.items() if name.lower() == 'content-type'), '')
+        with self._lock:
+            offset, length = self._append(record)
+            self._index.write(json.dumps({
+                'url': url, 'offset': offset, 'length': length,
+                'status': status, 'content_type': content_type.lower(),
+            }) + '\n')
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+            self._index.close()
+
+
+class WarcReader:
+    """Memory-mapped reader for archives written by WarcWriter"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        self.index = self._load_index()
+
+    def _load_index(self) -> List[dict]:
+        index_path = self.path + '.idx'
+        if os.path.exists(index_path):
+            with open(index_path, 'r', encoding='utf-8') as f:
+                return [json.loads(line) for line in f if line.strip()]
+        return self._rebuild_index()
+
+    def _rebuild_index(self) -> List[dict]:
+        """Recover the index by walking the gzip members of the archive"""
+        index = []
+        offset = 0
+        while offset < len(self._map):
+            length = self._member_length(offset)
+            if length <= 0:
+                break
+            parsed = self._parse_record(gzip.decompress(self._map[offset:offset + length]))
+            if parsed:
+                url, status, content_type, _ = parsed
+                index.append({'url': url, 'offset': offset, 'length': length,
+                              'status': status, 'content_type': content_type})
+            offset += length
+        return index
+
+    def _member_length(self, offset: int) -> int:
+        """Return the compressed length of the gzip member starting at offset"""
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        position = offset
+        while not decompressor.eof and position < len(self._map):
+            chunk = self._map[position:position + 65536]
+            decompressor.decompress(chunk)
+            position += len(chunk)
+        return position - offset - len(decompressor.unused_data)
+
+    @staticmethod
+    def _parse_record(record: bytes) -> Optional[Tuple[str, int, str, bytes]]:
+        """Return (url, status, content_type, body) for a response record, None for other records"""
+        warc_head, _, block = record.partition(b'\r\n\r\n')
+        warc_headers = {}
+        for line in warc_head.decode('utf-8', 'replace').split('\r\n')[1:]:
+            name, _, value = line.partition(':')
+            warc_headers[name.strip().lower()] = value.strip()
+        if warc_headers.get('warc-type') != 'response':
+            return None
+
+        block = block[:int(warc_headers.get('content-length', len(block)))]
+        http_head, _, body = block.partition(b'\r\n\r\n')
+        http_lines = http_head.decode('latin-1').split('\r\n')
+        parts = http_lines[0].split(' ', 2)
+        status = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
+        content_type = ''
+        for line in http_lines[1:]:
+            name, _, value = line.partition(':')
+            if name.strip().lower() == 'content-type':
+                content_type = value.strip().lower()
+        return warc_headers.get('warc-target-uri', ''), status, content_type, body
+
+    def read(self, entry: dict) -> Tuple[str, int, str, bytes]:
+        """Read the record described by an index entry"""
+        member = self._map[entry['offset']:entry['offset'] + entry['length']]
+        return self._parse_record(gzip.decompress(member))
+
+    def __iter__(self) -> Iterator[Tuple[str, int, str, bytes]]:
+        for entry in self.index:
+            yield self.read(entry)
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()